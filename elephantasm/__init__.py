@@ -19,53 +19,114 @@ With explicit client:
     >>> with Elephantasm(api_key="sk_live_...", anima_id="...") as client:
     ...     pack = client.inject()
     ...     client.extract(EventType.MESSAGE_IN, "Hello!")
+
+Async:
+    >>> from elephantasm import AsyncElephantasm
+    >>> async with AsyncElephantasm(api_key="sk_live_...", anima_id="...") as client:
+    ...     pack = await client.inject()
+    ...     await client.extract(EventType.MESSAGE_IN, "Hello!")
 """
 
 __version__ = "0.2.0"
 
-from .client import Elephantasm
-from .exceptions import (
-    AuthenticationError,
-    ElephantasmError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
-from .functions import create_anima, extract, inject
-from .types import (
-    Anima,
-    AnimaCreate,
-    Event,
-    EventCreate,
-    EventType,
-    IdentityContext,
-    Memory,
-    MemoryPack,
-    MemoryState,
-    ScoredKnowledge,
-    ScoredMemory,
-    TemporalContext,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncElephantasm
+    from .buffer import BufferedExtractor
+    from .client import Elephantasm
+    from .exceptions import (
+        AuthenticationError,
+        ElephantasmError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+    )
+    from .functions import aextract, ainject, create_anima, extract, inject
+    from .types import (
+        Anima,
+        AnimaCreate,
+        Event,
+        EventCreate,
+        EventType,
+        EventTypeStr,
+        IdentityContext,
+        Memory,
+        MemoryPack,
+        MemoryState,
+        MemoryStateStr,
+        ScoredKnowledge,
+        ScoredMemory,
+        TemporalContext,
+    )
+
+# Public name -> submodule defining it. Submodules (and with them httpx and
+# pydantic) are only imported when one of their names is first accessed.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AsyncElephantasm": ".async_client",
+    "BufferedExtractor": ".buffer",
+    "Elephantasm": ".client",
+    **dict.fromkeys(
+        [
+            "AuthenticationError",
+            "ElephantasmError",
+            "NotFoundError",
+            "RateLimitError",
+            "ServerError",
+            "ValidationError",
+        ],
+        ".exceptions",
+    ),
+    **dict.fromkeys(
+        ["aextract", "ainject", "create_anima", "extract", "inject"], ".functions"
+    ),
+    **dict.fromkeys(
+        [
+            "Anima",
+            "AnimaCreate",
+            "Event",
+            "EventCreate",
+            "EventType",
+            "EventTypeStr",
+            "IdentityContext",
+            "Memory",
+            "MemoryPack",
+            "MemoryState",
+            "MemoryStateStr",
+            "ScoredKnowledge",
+            "ScoredMemory",
+            "TemporalContext",
+        ],
+        ".types",
+    ),
+}
 
 __all__ = [
     # Version
     "__version__",
     # Client
     "Elephantasm",
+    "AsyncElephantasm",
+    "BufferedExtractor",
     # Functions
     "create_anima",
     "inject",
     "extract",
+    "ainject",
+    "aextract",
     # Types
     "Anima",
     "AnimaCreate",
     "Event",
     "EventCreate",
     "EventType",
+    "EventTypeStr",
     "Memory",
     "MemoryPack",
     "MemoryState",
+    "MemoryStateStr",
     "ScoredMemory",
     "ScoredKnowledge",
     "IdentityContext",
@@ -78,3 +139,18 @@ __all__ = [
     "ValidationError",
     "ServerError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access (PEP 562)."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,380 @@
+"""Async Elephantasm client for concurrent HTTP API communication."""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import httpx
+
+from .client import (
+    _DEFAULT_LIMITS,
+    _RETRY_STATUSES,
+    _build_event_payload,
+    _dumps,
+    _handle_response,
+    _InjectCache,
+    _load,
+    _PromptScanner,
+    _retry_delay,
+)
+from .config import ElephantasmSettings
+from .types import Anima, Event, EventCreate, EventTypeStr, MemoryPack
+
+
+class AsyncElephantasm:
+    """Async HTTP client for Elephantasm Long-Term Agentic Memory API.
+
+    Mirrors `Elephantasm`, but every network call is a coroutine so many
+    events can be captured concurrently.
+
+    Example:
+        >>> import asyncio
+        >>> from elephantasm import AsyncElephantasm, EventType
+        >>> async def main():
+        ...     async with AsyncElephantasm(api_key="sk_live_...", anima_id="...") as client:
+        ...         await asyncio.gather(
+        ...             client.extract(EventType.MESSAGE_IN, "Hello!", role="user"),
+        ...             client.extract(EventType.MESSAGE_OUT, "Hi!", role="assistant"),
+        ...         )
+        ...         pack = await client.inject()
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        anima_id: str | None = None,
+        endpoint: str | None = None,
+        timeout: int | None = None,
+        http2: bool | None = None,
+        retry_max_attempts: int | None = None,
+        inject_cache_ttl: float | None = None,
+        strict: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the async Elephantasm client.
+
+        Args:
+            api_key: API key for authentication. Falls back to ELEPHANTASM_API_KEY.
+            anima_id: Default anima ID. Falls back to ELEPHANTASM_ANIMA_ID.
+            endpoint: API endpoint URL. Falls back to ELEPHANTASM_ENDPOINT.
+            timeout: Request timeout in seconds. Falls back to ELEPHANTASM_TIMEOUT.
+            http2: Use HTTP/2 connections. Falls back to ELEPHANTASM_HTTP2.
+            retry_max_attempts: Attempts per request on 429/5xx responses, including
+                the first. Falls back to ELEPHANTASM_RETRY_MAX_ATTEMPTS.
+            inject_cache_ttl: Seconds to reuse the MemoryPack from an identical
+                inject() call; 0 disables caching. Falls back to
+                ELEPHANTASM_INJECT_CACHE_TTL.
+            strict: Validate responses into fully typed models instead of trusting
+                the server's data. Falls back to ELEPHANTASM_STRICT.
+            transport: Custom httpx transport (e.g. ``httpx.MockTransport`` in
+                tests). Replaces the default pooled transport, so http2 and
+                connection retries are not applied.
+
+        Raises:
+            ValueError: If no API key is provided or found in environment.
+        """
+        settings = ElephantasmSettings.from_env()
+        self.api_key = api_key or settings.api_key
+        self.anima_id = anima_id or settings.anima_id
+        self.endpoint = (endpoint or settings.endpoint).rstrip("/")
+        self.timeout = timeout or settings.timeout
+        self.http2 = settings.http2 if http2 is None else http2
+        self.retry_max_attempts = max(
+            1,
+            settings.retry_max_attempts if retry_max_attempts is None else retry_max_attempts,
+        )
+        self.retry_base = settings.retry_base
+        self.inject_cache_ttl = (
+            settings.inject_cache_ttl if inject_cache_ttl is None else inject_cache_ttl
+        )
+        self._inject_cache = (
+            _InjectCache(self.inject_cache_ttl) if self.inject_cache_ttl > 0 else None
+        )
+        self.strict = settings.strict if strict is None else strict
+
+        if not self.api_key:
+            raise ValueError(
+                "API key required. Provide api_key parameter or set ELEPHANTASM_API_KEY."
+            )
+
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.endpoint}/api",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=self.timeout,
+            transport=transport
+            or httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=_DEFAULT_LIMITS,
+                retries=self.retry_max_attempts - 1,
+            ),
+        )
+
+    async def create_anima(
+        self,
+        name: str,
+        description: str | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Anima:
+        """Create a new anima (agent entity).
+
+        Args:
+            name: Human-readable name for the anima.
+            description: Optional description.
+            meta: Optional metadata dictionary.
+
+        Returns:
+            Created Anima object.
+        """
+        payload: dict[str, Any] = {"name": name}
+        if description is not None:
+            payload["description"] = description
+        if meta is not None:
+            payload["meta"] = meta
+        response = await self._request("POST", "/animas", body=payload)
+        result = _handle_response(response)
+        return _load(Anima, result, self.strict)
+
+    async def inject(
+        self,
+        anima_id: str | UUID | None = None,
+        query: str | None = None,
+        preset: str | None = None,
+    ) -> MemoryPack | None:
+        """Retrieve the latest memory pack for context injection.
+
+        Args:
+            anima_id: Anima ID. Falls back to client's default anima_id.
+            query: Optional query for semantic retrieval.
+            preset: Optional preset name (conversational, self_determined).
+
+        Returns:
+            MemoryPack with context ready for LLM injection, or None if no packs exist.
+            With inject_cache_ttl set, repeated calls within the TTL return the
+            same MemoryPack instance without a network request.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+        """
+        aid = anima_id or self.anima_id
+        if not aid:
+            raise ValueError(
+                "anima_id required. Provide parameter or set default in client."
+            )
+        if not isinstance(aid, str):
+            aid = str(aid)
+
+        cache_key = (aid, query, preset)
+        if self._inject_cache is not None:
+            pack = self._inject_cache.get(cache_key)
+            if pack is not None:
+                return pack
+
+        params: dict[str, Any] = {}
+        if query:
+            params["query"] = query
+        if preset:
+            params["preset"] = preset
+
+        response = await self._request(
+            "GET", f"/animas/{aid}/memory-packs/latest", params=params
+        )
+        result = _handle_response(response)
+        if result is None:
+            return None
+        pack = _load(MemoryPack, result, self.strict)
+        if self._inject_cache is not None:
+            self._inject_cache.put(cache_key, pack)
+        return pack
+
+    async def inject_lite(
+        self,
+        anima_id: str | UUID | None = None,
+        query: str | None = None,
+        preset: str | None = None,
+    ) -> str | None:
+        """Retrieve only the prompt string of the latest memory pack.
+
+        Streams the response and stops reading once `content.context` has been
+        parsed, skipping the rest of the pack. Equivalent to
+        `inject(...).as_prompt()` for callers that only need the prompt.
+        Requires the optional `ijson` dependency (`elephantasm[stream]`).
+
+        Args:
+            anima_id: Anima ID. Falls back to client's default anima_id.
+            query: Optional query for semantic retrieval.
+            preset: Optional preset name (conversational, self_determined).
+
+        Returns:
+            Formatted context string for LLM injection, or None if no packs exist.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+            ImportError: If ijson is not installed.
+        """
+        aid = anima_id or self.anima_id
+        if not aid:
+            raise ValueError(
+                "anima_id required. Provide parameter or set default in client."
+            )
+        scanner = _PromptScanner()
+
+        params: dict[str, Any] = {}
+        if query:
+            params["query"] = query
+        if preset:
+            params["preset"] = preset
+
+        response = await self._request(
+            "GET", f"/animas/{aid}/memory-packs/latest", params=params, stream=True
+        )
+        try:
+            if not response.is_success:
+                await response.aread()
+                _handle_response(response)
+            async for chunk in response.aiter_bytes():
+                if scanner.feed(chunk):
+                    break
+            return scanner.finish()
+        finally:
+            await response.aclose()
+
+    async def extract(
+        self,
+        event_type: EventTypeStr | str,
+        content: str,
+        anima_id: str | UUID | None = None,
+        session_id: str | None = None,
+        role: str | None = None,
+        author: str | None = None,
+        occurred_at: datetime | None = None,
+        meta: dict[str, Any] | None = None,
+        importance_score: float | None = None,
+    ) -> Event:
+        """Capture an event (message, tool call, etc.) for memory synthesis.
+
+        Args:
+            event_type: Type of event (e.g., EventType.MESSAGE_IN).
+            content: Event content (message text, tool output, etc.).
+            anima_id: Anima ID. Falls back to client's default anima_id.
+            session_id: Optional session identifier for grouping events.
+            role: Message role (user, assistant, system, tool).
+            author: Author identifier (username, model name, tool name).
+            occurred_at: When the event occurred (defaults to now).
+            meta: Optional metadata dictionary.
+            importance_score: Optional importance score (0.0-1.0).
+
+        Returns:
+            Created Event object.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+        """
+        payload = self._event_payload(
+            event_type=event_type,
+            content=content,
+            anima_id=anima_id,
+            session_id=session_id,
+            role=role,
+            author=author,
+            occurred_at=occurred_at,
+            meta=meta,
+            importance_score=importance_score,
+        )
+        response = await self._request("POST", "/events", body=payload)
+        result = _handle_response(response)
+        return _load(Event, result, self.strict)
+
+    async def extract_many(self, events: list[dict[str, Any] | EventCreate]) -> list[Event]:
+        """Capture several events in a single request.
+
+        Args:
+            events: Events to capture. Each item is either an EventCreate or a
+                dict of `extract()` keyword arguments (e.g.
+                ``{"event_type": EventType.MESSAGE_IN, "content": "Hello!"}``).
+
+        Returns:
+            Created Event objects, in request order.
+
+        Raises:
+            ValueError: If an event has no anima_id and no default set.
+        """
+        payloads = [
+            e.model_dump(exclude_none=True)
+            if isinstance(e, EventCreate)
+            else self._event_payload(**e)
+            for e in events
+        ]
+        return await self._post_events(payloads)
+
+    async def _post_events(self, payloads: list[dict[str, Any]]) -> list[Event]:
+        """POST pre-built event payloads to the batch endpoint."""
+        if not payloads:
+            return []
+        response = await self._request("POST", "/events/batch", body=payloads)
+        result = _handle_response(response)
+        return [_load(Event, item, self.strict) for item in result]
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying 429/5xx responses with exponential backoff.
+
+        Connection failures are retried by the transport; this loop handles
+        responses the server asked us to retry, honoring Retry-After. With
+        stream=True the body is left unread and the caller must close it.
+        """
+        if body is not None:
+            kwargs["content"] = _dumps(body)
+        request = self._client.build_request(method, url, **kwargs)
+        attempt = 0
+        while True:
+            response = await self._client.send(request, stream=stream)
+            attempt += 1
+            if (
+                response.status_code not in _RETRY_STATUSES
+                or attempt >= self.retry_max_attempts
+            ):
+                return response
+            if stream:
+                await response.aclose()
+            await asyncio.sleep(_retry_delay(response, attempt, self.retry_base))
+
+    def _event_payload(
+        self,
+        event_type: EventTypeStr | str,
+        content: str,
+        anima_id: str | UUID | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Resolve the target anima and build the JSON payload for one event.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+        """
+        aid = anima_id if anima_id else self.anima_id
+        if not aid:
+            raise ValueError(
+                "anima_id required. Provide parameter or set default in client."
+            )
+        return _build_event_payload(aid, event_type, content, **fields)
+
+    async def close(self) -> None:
+        """Close the HTTP client and release resources."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncElephantasm":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit - closes the client."""
+        await self.close()
@@ -0,0 +1,187 @@
+"""Buffered event capture that sends extract() calls in batches."""
+
+import atexit
+import logging
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from .client import Elephantasm
+from .exceptions import ElephantasmError
+from .types import Event, EventTypeStr
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedExtractor:
+    """Queue events locally and send them via `Elephantasm.extract_many()`.
+
+    Events are flushed when the buffer reaches `batch_size`, when the context
+    manager exits, and, if `flush_interval` is set, periodically from a
+    background thread so no event waits longer than the interval. With the
+    background thread running, a full batch is handed to it as well, so
+    `extract()` never waits on the network.
+
+    Example:
+        >>> from elephantasm import BufferedExtractor, Elephantasm, EventType
+        >>> client = Elephantasm(api_key="sk_live_...", anima_id="...")
+        >>> with BufferedExtractor(client) as buffer:
+        ...     buffer.extract(EventType.MESSAGE_IN, "Hello!", role="user")
+        ...     buffer.extract(EventType.MESSAGE_OUT, "Hi there!", role="assistant")
+    """
+
+    def __init__(
+        self,
+        client: Elephantasm,
+        batch_size: int = 16,
+        flush_interval: float | None = None,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            client: Client used to send batches.
+            batch_size: Number of queued events that triggers a flush.
+            flush_interval: Optional maximum seconds an event stays queued.
+        """
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[tuple[dict[str, Any], Future[Event]]] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        if flush_interval is not None:
+            self._thread = threading.Thread(
+                target=self._run, name="elephantasm-flush", daemon=True
+            )
+            self._thread.start()
+
+        # Flush queued events on interpreter shutdown. atexit runs handlers in
+        # reverse order, so this fires before the client itself is closed.
+        atexit.register(self.close)
+
+    def extract(
+        self,
+        event_type: EventTypeStr | str,
+        content: str,
+        anima_id: str | UUID | None = None,
+        session_id: str | None = None,
+        role: str | None = None,
+        author: str | None = None,
+        occurred_at: datetime | None = None,
+        meta: dict[str, Any] | None = None,
+        importance_score: float | None = None,
+    ) -> Future[Event]:
+        """Queue an event for the next batch.
+
+        Accepts the same arguments as `Elephantasm.extract()`. Invalid event
+        types and missing anima IDs are rejected immediately.
+
+        Returns:
+            Future resolving to the created Event once its batch is sent, or
+            to the batch's exception if sending fails.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+            RuntimeError: If the buffer has been closed.
+        """
+        payload = self.client._event_payload(
+            event_type=event_type,
+            content=content,
+            anima_id=anima_id,
+            session_id=session_id,
+            role=role,
+            author=author,
+            occurred_at=occurred_at,
+            meta=meta,
+            importance_score=importance_score,
+        )
+        return self._submit(payload)
+
+    def _submit(self, payload: dict[str, Any]) -> Future[Event]:
+        """Queue a pre-built event payload, flushing if the batch is full.
+
+        Raises:
+            RuntimeError: If the buffer has been closed, since nothing would
+                ever send the event.
+        """
+        future: Future[Event] = Future()
+        with self._lock:
+            if self._stopped.is_set():
+                raise RuntimeError("Cannot queue events after close().")
+            self._buffer.append((payload, future))
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+        return future
+
+    def flush(self) -> list[Event]:
+        """Send all queued events.
+
+        Returns:
+            Created Event objects, or an empty list if nothing was queued.
+
+        Raises:
+            ElephantasmError: If the request fails or the response does not
+                contain one event per queued payload. Every queued Future
+                receives the same exception.
+        """
+        with self._lock:
+            pending, self._buffer = self._buffer, []
+        try:
+            events = self.client._post_events([payload for payload, _ in pending])
+            if len(events) != len(pending):
+                raise ElephantasmError(
+                    f"Batch response has {len(events)} events for "
+                    f"{len(pending)} sent."
+                )
+        except Exception as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+            raise
+        for (_, future), event in zip(pending, events):
+            future.set_result(event)
+        return events
+
+    def close(self) -> None:
+        """Stop the background thread and flush remaining events."""
+        atexit.unregister(self.close)
+        # Set under the lock so no event is queued after the final flush below
+        with self._lock:
+            self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        """Background loop flushing every `flush_interval` seconds or when woken."""
+        while True:
+            self._wake.wait(self.flush_interval)
+            if self._stopped.is_set():
+                return
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered Elephantasm events")
+
+    def __len__(self) -> int:
+        """Number of queued events."""
+        return len(self._buffer)
+
+    def __enter__(self) -> "BufferedExtractor":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit - flushes queued events."""
+        self.close()
@@ -1,12 +1,21 @@
 """Main Elephantasm client class for HTTP API communication."""
 
+import functools
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar, get_args
 from uuid import UUID
 
 import httpx
+import orjson
+from pydantic import BaseModel
 
-from .config import settings
+from .config import ElephantasmSettings
 from .exceptions import (
     AuthenticationError,
     ElephantasmError,
@@ -15,9 +24,40 @@ from .exceptions import (
     ServerError,
     ValidationError,
 )
-from .types import Anima, AnimaCreate, Event, EventCreate, EventType, MemoryPack
+from .types import (
+    _VALID_EVENT_TYPES,
+    Anima,
+    Event,
+    EventCreate,
+    EventTypeStr,
+    MemoryPack,
+)
+
+if TYPE_CHECKING:
+    from .buffer import BufferedExtractor
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Connection pool sized for bursty extract() traffic over keep-alive connections
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
 
-# Mapping from uppercase enum names to dot-notation API values
+# Responses worth retrying, and the longest we will sleep between attempts
+_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+_RETRY_CAP = 4.0
+
+# Error responses with a dedicated exception type (5xx map to ServerError)
+_STATUS_EXCEPTIONS: dict[int, type[ElephantasmError]] = {
+    401: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+    429: RateLimitError,
+}
+
+# Mapping from uppercase EventType attribute names to dot-notation API values
 _EVENT_TYPE_ALIASES: dict[str, str] = {
     "MESSAGE_IN": "message.in",
     "MESSAGE_OUT": "message.out",
@@ -26,25 +66,18 @@ _EVENT_TYPE_ALIASES: dict[str, str] = {
     "SYSTEM": "system",
 }
 
-_VALID_EVENT_TYPES: set[str] = {
-    "message.in", "message.out", "tool.call", "tool.result", "system",
-}
-
 
-def _resolve_event_type(event_type: str | EventType) -> str:
+def _resolve_event_type(event_type: EventTypeStr | str) -> str:
     """Resolve event_type to a valid API string value.
 
     Accepts:
-      - EventType enum members (EventType.TOOL_CALL -> "tool.call")
+      - EventType constants (EventType.TOOL_CALL -> "tool.call")
       - Dot-notation strings ("tool.call" -> "tool.call")
       - Uppercase enum names ("TOOL_CALL" -> "tool.call")
 
     Raises:
         ValueError: For unrecognized strings.
     """
-    if isinstance(event_type, EventType):
-        return event_type.value
-
     if event_type in _VALID_EVENT_TYPES:
         return event_type
 
@@ -55,11 +88,241 @@ def _resolve_event_type(event_type: str | EventType) -> str:
     raise ValueError(
         f"Invalid event_type '{event_type}'. "
         f"Valid values: {sorted(_VALID_EVENT_TYPES)}. "
-        f"Hint: use EventType enum members (e.g. EventType.MESSAGE_IN) or "
+        f"Hint: use EventType constants (e.g. EventType.MESSAGE_IN) or "
         f"dot-notation strings (e.g. 'message.in')."
     )
 
 
+def _build_event_payload(
+    anima_id: str | UUID,
+    event_type: EventTypeStr | str,
+    content: str,
+    session_id: str | None = None,
+    role: str | None = None,
+    author: str | None = None,
+    occurred_at: datetime | None = None,
+    meta: dict[str, Any] | None = None,
+    importance_score: float | None = None,
+) -> dict[str, Any]:
+    """Build the JSON payload for a single event.
+
+    Raises:
+        ValueError: For unrecognized event types.
+    """
+    # Normalize and validate event_type before API call
+    event_type_str = _resolve_event_type(event_type)
+
+    # Build the JSON body directly: the server validates it, so constructing an
+    # EventCreate model here would only add per-call overhead. Datetimes are left
+    # for orjson to serialize natively.
+    payload: dict[str, Any] = {
+        "anima_id": anima_id if isinstance(anima_id, str) else str(anima_id),
+        "event_type": event_type_str,
+        "content": content,
+        "meta": meta or {},
+    }
+    if session_id is not None:
+        payload["session_id"] = session_id
+    if role is not None:
+        payload["role"] = role
+    if author is not None:
+        payload["author"] = author
+    if occurred_at is not None:
+        payload["occurred_at"] = occurred_at
+    if importance_score is not None:
+        payload["importance_score"] = importance_score
+    return payload
+
+
+def _retry_delay(response: httpx.Response, attempt: int, base: float) -> float:
+    """Seconds to wait before retrying a failed request.
+
+    Uses the server's Retry-After header when it holds a number of seconds,
+    otherwise exponential backoff with full jitter. Both are capped at 4s.
+
+    Args:
+        response: The retryable response.
+        attempt: Number of attempts made so far (1 after the first request).
+        base: Base delay in seconds.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_CAP)
+        except ValueError:
+            pass
+    return random.uniform(0, min(_RETRY_CAP, base * 2 ** (attempt - 1)))
+
+
+def _dumps(body: Any) -> bytes:
+    """Serialize a request body to JSON bytes.
+
+    orjson encodes datetime and UUID values natively, so payloads can carry
+    them without a pydantic JSON-mode dump.
+    """
+    return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing "Z" on Python 3.10."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@functools.cache
+def _coercers(model: type[BaseModel]) -> tuple[tuple[str, Callable[[str], Any]], ...]:
+    """Return (field name, parser) pairs for a model's UUID and datetime fields."""
+    parsers: dict[Any, Callable[[str], Any]] = {UUID: UUID, datetime: _parse_datetime}
+    found = []
+    for name, field in model.model_fields.items():
+        for tp in (field.annotation, *get_args(field.annotation)):
+            if tp in parsers:
+                found.append((name, parsers[tp]))
+                break
+    return tuple(found)
+
+
+def _load(model: type[_ModelT], data: dict[str, Any], strict: bool) -> _ModelT:
+    """Build a response model from server data.
+
+    The API has already validated its responses, so by default the model is
+    populated without validation after a single pass that parses its UUID and
+    datetime fields. Pass strict=True to run full pydantic validation.
+    """
+    if strict:
+        return model.model_validate(data)
+    data = dict(data)
+    try:
+        for name, parse in _coercers(model):
+            value = data.get(name)
+            if isinstance(value, str):
+                data[name] = parse(value)
+    except ValueError:
+        # Let pydantic report the malformed field
+        return model.model_validate(data)
+    return model.model_construct(**data)
+
+
+def _handle_response(response: httpx.Response) -> dict[str, Any] | None:
+    """Handle API response and map errors to exceptions.
+
+    Args:
+        response: HTTP response from API.
+
+    Returns:
+        Parsed JSON response data, or None if response body is null.
+
+    Raises:
+        AuthenticationError: On 401 responses.
+        NotFoundError: On 404 responses.
+        ValidationError: On 422 responses.
+        RateLimitError: On 429 responses.
+        ServerError: On 5xx responses.
+        ElephantasmError: On other error responses.
+    """
+    if response.is_success:
+        return orjson.loads(response.content)
+
+    try:
+        detail = orjson.loads(response.content).get("detail", response.text)
+    except Exception:
+        detail = response.text
+
+    status = response.status_code
+    exc_cls = _STATUS_EXCEPTIONS.get(status) or (ServerError if status >= 500 else None)
+
+    if exc_cls is None:
+        raise ElephantasmError(detail, status_code=status)
+    if exc_cls is ValidationError:
+        # 422 details are usually a list of field errors
+        raise ValidationError(str(detail))
+    raise exc_cls(detail)
+
+
+def _import_ijson() -> Any:
+    """Import the optional ijson dependency used by inject_lite()."""
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            "inject_lite() requires ijson. Install with: pip install 'elephantasm[stream]'"
+        ) from e
+    return ijson
+
+
+class _PromptScanner:
+    """Incrementally scan a memory pack JSON body for `content.context`.
+
+    Chunks are fed as they arrive so the caller can stop reading the
+    response as soon as the prompt string has been found.
+    """
+
+    def __init__(self) -> None:
+        ijson = _import_ijson()
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events)
+        self.found = False
+        self.context: str | None = ""
+
+    def feed(self, chunk: bytes) -> bool:
+        """Parse the next chunk; return True once the result is known."""
+        self._parser.send(chunk)
+        return self._scan()
+
+    def finish(self) -> str | None:
+        """Return the prompt, or None if the body was JSON null."""
+        if not self.found:
+            self._parser.close()
+            self._scan()
+        return self.context
+
+    def _scan(self) -> bool:
+        for prefix, event, value in self._events:
+            if prefix == "content.context" and event in ("string", "null"):
+                # A null context matches MemoryPack.as_prompt() returning None
+                self.context = value
+                self.found = True
+                break
+            if prefix == "" and event == "null":
+                self.context = None
+                self.found = True
+                break
+        del self._events[:]
+        return self.found
+
+
+class _InjectCache:
+    """Thread-safe TTL cache of memory packs with LRU eviction."""
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[float, MemoryPack]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> MemoryPack | None:
+        """Return the cached pack for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, pack = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return pack
+
+    def put(self, key: tuple, pack: MemoryPack) -> None:
+        """Store pack under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), pack)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
 class Elephantasm:
     """HTTP client for Elephantasm Long-Term Agentic Memory API.
 
@@ -76,6 +339,14 @@ class Elephantasm:
         anima_id: str | None = None,
         endpoint: str | None = None,
         timeout: int | None = None,
+        http2: bool | None = None,
+        retry_max_attempts: int | None = None,
+        inject_cache_ttl: float | None = None,
+        strict: bool | None = None,
+        transport: httpx.BaseTransport | None = None,
+        background_extract: bool = False,
+        batch_size: int = 8,
+        flush_interval: float = 0.5,
     ):
         """Initialize the Elephantasm client.
 
@@ -84,14 +355,44 @@ class Elephantasm:
             anima_id: Default anima ID. Falls back to ELEPHANTASM_ANIMA_ID.
             endpoint: API endpoint URL. Falls back to ELEPHANTASM_ENDPOINT.
             timeout: Request timeout in seconds. Falls back to ELEPHANTASM_TIMEOUT.
+            http2: Use HTTP/2 connections. Falls back to ELEPHANTASM_HTTP2.
+            retry_max_attempts: Attempts per request on 429/5xx responses, including
+                the first. Falls back to ELEPHANTASM_RETRY_MAX_ATTEMPTS.
+            inject_cache_ttl: Seconds to reuse the MemoryPack from an identical
+                inject() call; 0 disables caching. Falls back to
+                ELEPHANTASM_INJECT_CACHE_TTL.
+            strict: Validate responses into fully typed models instead of trusting
+                the server's data. Falls back to ELEPHANTASM_STRICT.
+            transport: Custom httpx transport (e.g. ``httpx.MockTransport`` in
+                tests). Replaces the default pooled transport, so http2 and
+                connection retries are not applied.
+            background_extract: Start a background worker that sends
+                submit_extract() calls in batches instead of blocking on each
+                request.
+            batch_size: Queued events that trigger a background send.
+            flush_interval: Maximum seconds a queued event waits to be sent.
 
         Raises:
             ValueError: If no API key is provided or found in environment.
         """
+        settings = ElephantasmSettings.from_env()
         self.api_key = api_key or settings.api_key
         self.anima_id = anima_id or settings.anima_id
         self.endpoint = (endpoint or settings.endpoint).rstrip("/")
         self.timeout = timeout or settings.timeout
+        self.http2 = settings.http2 if http2 is None else http2
+        self.retry_max_attempts = max(
+            1,
+            settings.retry_max_attempts if retry_max_attempts is None else retry_max_attempts,
+        )
+        self.retry_base = settings.retry_base
+        self.inject_cache_ttl = (
+            settings.inject_cache_ttl if inject_cache_ttl is None else inject_cache_ttl
+        )
+        self._inject_cache = (
+            _InjectCache(self.inject_cache_ttl) if self.inject_cache_ttl > 0 else None
+        )
+        self.strict = settings.strict if strict is None else strict
 
         if not self.api_key:
             raise ValueError(
@@ -105,47 +406,20 @@ class Elephantasm:
                 "Content-Type": "application/json",
             },
             timeout=self.timeout,
+            transport=transport
+            or httpx.HTTPTransport(
+                http2=self.http2,
+                limits=_DEFAULT_LIMITS,
+                retries=self.retry_max_attempts - 1,
+            ),
         )
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any] | None:
-        """Handle API response and map errors to exceptions.
-
-        Args:
-            response: HTTP response from API.
-
-        Returns:
-            Parsed JSON response data, or None if response body is null.
-
-        Raises:
-            AuthenticationError: On 401 responses.
-            NotFoundError: On 404 responses.
-            ValidationError: On 422 responses.
-            RateLimitError: On 429 responses.
-            ServerError: On 5xx responses.
-            ElephantasmError: On other error responses.
-        """
-        if response.is_success:
-            return response.json()
+        self._extractor: BufferedExtractor | None = None
+        if background_extract:
+            # Imported here because buffer.py imports this module
+            from . import buffer
 
-        try:
-            detail = response.json().get("detail", response.text)
-        except Exception:
-            detail = response.text
-
-        status = response.status_code
-
-        if status == 401:
-            raise AuthenticationError(detail)
-        elif status == 404:
-            raise NotFoundError(detail)
-        elif status == 422:
-            raise ValidationError(str(detail))
-        elif status == 429:
-            raise RateLimitError(detail)
-        elif status >= 500:
-            raise ServerError(detail)
-        else:
-            raise ElephantasmError(detail, status_code=status)
+            self._extractor = buffer.BufferedExtractor(self, batch_size, flush_interval)
 
     def create_anima(
         self,
@@ -163,10 +437,14 @@ class Elephantasm:
         Returns:
             Created Anima object.
         """
-        data = AnimaCreate(name=name, description=description, meta=meta)
-        response = self._client.post("/animas", json=data.model_dump(exclude_none=True))
-        result = self._handle_response(response)
-        return Anima(**result)
+        payload: dict[str, Any] = {"name": name}
+        if description is not None:
+            payload["description"] = description
+        if meta is not None:
+            payload["meta"] = meta
+        response = self._request("POST", "/animas", body=payload)
+        result = _handle_response(response)
+        return _load(Anima, result, self.strict)
 
     def inject(
         self,
@@ -183,15 +461,25 @@ class Elephantasm:
 
         Returns:
             MemoryPack with context ready for LLM injection, or None if no packs exist.
+            With inject_cache_ttl set, repeated calls within the TTL return the
+            same MemoryPack instance without a network request.
 
         Raises:
             ValueError: If no anima_id provided and no default set.
         """
-        aid = str(anima_id) if anima_id else self.anima_id
+        aid = anima_id or self.anima_id
         if not aid:
             raise ValueError(
                 "anima_id required. Provide parameter or set default in client."
             )
+        if not isinstance(aid, str):
+            aid = str(aid)
+
+        cache_key = (aid, query, preset)
+        if self._inject_cache is not None:
+            pack = self._inject_cache.get(cache_key)
+            if pack is not None:
+                return pack
 
         params: dict[str, Any] = {}
         if query:
@@ -199,15 +487,72 @@ class Elephantasm:
         if preset:
             params["preset"] = preset
 
-        response = self._client.get(f"/animas/{aid}/memory-packs/latest", params=params)
-        result = self._handle_response(response)
+        response = self._request(
+            "GET", f"/animas/{aid}/memory-packs/latest", params=params
+        )
+        result = _handle_response(response)
         if result is None:
             return None
-        return MemoryPack(**result)
+        pack = _load(MemoryPack, result, self.strict)
+        if self._inject_cache is not None:
+            self._inject_cache.put(cache_key, pack)
+        return pack
+
+    def inject_lite(
+        self,
+        anima_id: str | UUID | None = None,
+        query: str | None = None,
+        preset: str | None = None,
+    ) -> str | None:
+        """Retrieve only the prompt string of the latest memory pack.
+
+        Streams the response and stops reading once `content.context` has been
+        parsed, skipping the rest of the pack. Equivalent to
+        `inject(...).as_prompt()` for callers that only need the prompt.
+        Requires the optional `ijson` dependency (`elephantasm[stream]`).
+
+        Args:
+            anima_id: Anima ID. Falls back to client's default anima_id.
+            query: Optional query for semantic retrieval.
+            preset: Optional preset name (conversational, self_determined).
+
+        Returns:
+            Formatted context string for LLM injection, or None if no packs exist.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+            ImportError: If ijson is not installed.
+        """
+        aid = anima_id or self.anima_id
+        if not aid:
+            raise ValueError(
+                "anima_id required. Provide parameter or set default in client."
+            )
+        scanner = _PromptScanner()
+
+        params: dict[str, Any] = {}
+        if query:
+            params["query"] = query
+        if preset:
+            params["preset"] = preset
+
+        response = self._request(
+            "GET", f"/animas/{aid}/memory-packs/latest", params=params, stream=True
+        )
+        try:
+            if not response.is_success:
+                response.read()
+                _handle_response(response)
+            for chunk in response.iter_bytes():
+                if scanner.feed(chunk):
+                    break
+            return scanner.finish()
+        finally:
+            response.close()
 
     def extract(
         self,
-        event_type: str | EventType,
+        event_type: EventTypeStr | str,
         content: str,
         anima_id: str | UUID | None = None,
         session_id: str | None = None,
@@ -236,35 +581,163 @@ class Elephantasm:
         Raises:
             ValueError: If no anima_id provided and no default set.
         """
-        aid = anima_id if anima_id else self.anima_id
-        if not aid:
-            raise ValueError(
-                "anima_id required. Provide parameter or set default in client."
-            )
+        payload = self._event_payload(
+            event_type=event_type,
+            content=content,
+            anima_id=anima_id,
+            session_id=session_id,
+            role=role,
+            author=author,
+            occurred_at=occurred_at,
+            meta=meta,
+            importance_score=importance_score,
+        )
+        response = self._request("POST", "/events", body=payload)
+        result = _handle_response(response)
+        return _load(Event, result, self.strict)
+
+    def submit_extract(
+        self,
+        event_type: EventTypeStr | str,
+        content: str,
+        anima_id: str | UUID | None = None,
+        session_id: str | None = None,
+        role: str | None = None,
+        author: str | None = None,
+        occurred_at: datetime | None = None,
+        meta: dict[str, Any] | None = None,
+        importance_score: float | None = None,
+    ) -> Future[Event]:
+        """Queue an event for the background worker and return immediately.
 
-        # Normalize and validate event_type before API call
-        event_type_str = _resolve_event_type(event_type)
+        Accepts the same arguments as `extract()`. Requires a client created
+        with background_extract=True.
 
-        data = EventCreate(
-            anima_id=UUID(str(aid)),
-            event_type=event_type_str,
+        Returns:
+            Future resolving to the created Event once its batch is sent; call
+            `.result()` only if you need the Event.
+
+        Raises:
+            ValueError: If background_extract is disabled, or no anima_id
+                provided and no default set.
+            RuntimeError: If the client has been closed.
+        """
+        if self._extractor is None:
+            raise ValueError("submit_extract() requires background_extract=True.")
+        return self._extractor.extract(
+            event_type=event_type,
             content=content,
+            anima_id=anima_id,
             session_id=session_id,
             role=role,
             author=author,
             occurred_at=occurred_at,
-            meta=meta or {},
+            meta=meta,
             importance_score=importance_score,
         )
 
-        payload = data.model_dump(mode="json", exclude_none=True)
-        response = self._client.post("/events", json=payload)
-        result = self._handle_response(response)
-        return Event(**result)
+    def extract_many(self, events: list[dict[str, Any] | EventCreate]) -> list[Event]:
+        """Capture several events in a single request.
+
+        Args:
+            events: Events to capture. Each item is either an EventCreate or a
+                dict of `extract()` keyword arguments (e.g.
+                ``{"event_type": EventType.MESSAGE_IN, "content": "Hello!"}``).
+
+        Returns:
+            Created Event objects, in request order.
+
+        Raises:
+            ValueError: If an event has no anima_id and no default set.
+        """
+        payloads = [
+            e.model_dump(exclude_none=True)
+            if isinstance(e, EventCreate)
+            else self._event_payload(**e)
+            for e in events
+        ]
+        return self._post_events(payloads)
+
+    def _post_events(self, payloads: list[dict[str, Any]]) -> list[Event]:
+        """POST pre-built event payloads to the batch endpoint."""
+        if not payloads:
+            return []
+        response = self._request("POST", "/events/batch", body=payloads)
+        result = _handle_response(response)
+        return [_load(Event, item, self.strict) for item in result]
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying 429/5xx responses with exponential backoff.
+
+        Connection failures are retried by the transport; this loop handles
+        responses the server asked us to retry, honoring Retry-After. With
+        stream=True the body is left unread and the caller must close it.
+        """
+        if body is not None:
+            kwargs["content"] = _dumps(body)
+        request = self._client.build_request(method, url, **kwargs)
+        attempt = 0
+        while True:
+            response = self._client.send(request, stream=stream)
+            attempt += 1
+            if (
+                response.status_code not in _RETRY_STATUSES
+                or attempt >= self.retry_max_attempts
+            ):
+                return response
+            if stream:
+                response.close()
+            time.sleep(_retry_delay(response, attempt, self.retry_base))
+
+    def _event_payload(
+        self,
+        event_type: EventTypeStr | str,
+        content: str,
+        anima_id: str | UUID | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Resolve the target anima and build the JSON payload for one event.
+
+        Raises:
+            ValueError: If no anima_id provided and no default set.
+        """
+        aid = anima_id if anima_id else self.anima_id
+        if not aid:
+            raise ValueError(
+                "anima_id required. Provide parameter or set default in client."
+            )
+        return _build_event_payload(aid, event_type, content, **fields)
+
+    def warmup(self) -> None:
+        """Open a pooled connection before the first real request.
+
+        Sends a cheap health check so the TLS handshake (and HTTP/2 preface)
+        is already done when the first inject() or extract() runs. Failures
+        are ignored; the connection is simply opened lazily instead.
+        """
+        try:
+            self._client.get("/health", timeout=2)
+        except httpx.HTTPError:
+            pass
 
     def close(self) -> None:
-        """Close the HTTP client and release resources."""
-        self._client.close()
+        """Send queued background events, then close the HTTP client.
+
+        The HTTP client is closed even if the final flush fails; the flush
+        error is then re-raised.
+        """
+        try:
+            if self._extractor is not None:
+                self._extractor.close()
+        finally:
+            self._client.close()
 
     def __enter__(self) -> "Elephantasm":
         """Context manager entry."""
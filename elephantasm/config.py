@@ -1,9 +1,21 @@
 """Configuration management via environment variables."""
 
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass
 
+_TRUE = frozenset({"1", "true", "yes", "on"})
 
-class ElephantasmSettings(BaseSettings):
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ("1", "true", "yes", "on" are true)."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE
+
+
+@dataclass(slots=True)
+class ElephantasmSettings:
     """SDK configuration loaded from environment variables.
 
     Environment variables:
@@ -11,14 +23,43 @@ class ElephantasmSettings(BaseSettings):
         ELEPHANTASM_ANIMA_ID: Default anima ID for operations
         ELEPHANTASM_ENDPOINT: API endpoint (default: https://api.elephantasm.com)
         ELEPHANTASM_TIMEOUT: Request timeout in seconds (default: 30)
+        ELEPHANTASM_HTTP2: Use HTTP/2 connections (default: true)
+        ELEPHANTASM_RETRY_MAX_ATTEMPTS: Attempts per request on 429/5xx (default: 3)
+        ELEPHANTASM_RETRY_BASE: Base backoff delay in seconds (default: 0.2)
+        ELEPHANTASM_INJECT_CACHE_TTL: Seconds to reuse identical inject() results
+            (default: 0, disabled)
+        ELEPHANTASM_STRICT: Validate API responses with pydantic (default: false)
+        ELEPHANTASM_WARMUP: Pre-open a connection for the default client (default: false)
     """
 
     api_key: str | None = None
     anima_id: str | None = None
     endpoint: str = "https://api.elephantasm.com"
     timeout: int = 30
+    http2: bool = True
+    retry_max_attempts: int = 3
+    retry_base: float = 0.2
+    inject_cache_ttl: float = 0.0
+    strict: bool = False
+    warmup: bool = False
 
-    model_config = {"env_prefix": "ELEPHANTASM_"}
-
+    @classmethod
+    def from_env(cls) -> "ElephantasmSettings":
+        """Build settings from the current ELEPHANTASM_* environment variables.
 
-settings = ElephantasmSettings()
+        Raises:
+            ValueError: If a numeric variable cannot be parsed.
+        """
+        env = os.environ
+        return cls(
+            api_key=env.get("ELEPHANTASM_API_KEY"),
+            anima_id=env.get("ELEPHANTASM_ANIMA_ID"),
+            endpoint=env.get("ELEPHANTASM_ENDPOINT", "https://api.elephantasm.com"),
+            timeout=int(env.get("ELEPHANTASM_TIMEOUT", "30")),
+            http2=_env_bool("ELEPHANTASM_HTTP2", True),
+            retry_max_attempts=int(env.get("ELEPHANTASM_RETRY_MAX_ATTEMPTS", "3")),
+            retry_base=float(env.get("ELEPHANTASM_RETRY_BASE", "0.2")),
+            inject_cache_ttl=float(env.get("ELEPHANTASM_INJECT_CACHE_TTL", "0")),
+            strict=_env_bool("ELEPHANTASM_STRICT", False),
+            warmup=_env_bool("ELEPHANTASM_WARMUP", False),
+        )
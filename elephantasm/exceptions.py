@@ -4,15 +4,27 @@
 class ElephantasmError(Exception):
     """Base exception for all Elephantasm errors."""
 
+    __slots__ = ("message", "status_code")
+
     def __init__(self, message: str, status_code: int | None = None):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
 
+    def __reduce__(self):
+        # Slot values are not part of BaseException's default pickle state
+        return (
+            self.__class__,
+            self.args,
+            {"message": self.message, "status_code": self.status_code},
+        )
+
 
 class AuthenticationError(ElephantasmError):
     """Raised when authentication fails (401)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(message, status_code=401)
 
@@ -20,6 +32,8 @@ class AuthenticationError(ElephantasmError):
 class NotFoundError(ElephantasmError):
     """Raised when a resource is not found (404)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found"):
         super().__init__(message, status_code=404)
 
@@ -27,6 +41,8 @@ class NotFoundError(ElephantasmError):
 class RateLimitError(ElephantasmError):
     """Raised when rate limit is exceeded (429)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Rate limit exceeded"):
         super().__init__(message, status_code=429)
 
@@ -34,6 +50,8 @@ class RateLimitError(ElephantasmError):
 class ValidationError(ElephantasmError):
     """Raised when request validation fails (422)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation failed"):
         super().__init__(message, status_code=422)
 
@@ -41,5 +59,7 @@ class ValidationError(ElephantasmError):
 class ServerError(ElephantasmError):
     """Raised when server returns 5xx error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Server error"):
         super().__init__(message, status_code=500)
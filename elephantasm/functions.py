@@ -1,14 +1,27 @@
 """Module-level convenience functions using a lazy default client."""
 
+import asyncio
+import atexit
+import threading
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from .async_client import AsyncElephantasm
 from .client import Elephantasm
-from .types import Anima, Event, EventType, MemoryPack
+from .config import ElephantasmSettings
+from .types import Anima, Event, EventTypeStr, MemoryPack
 
-# Lazy-initialized default client
+# Lazy-initialized default clients
 _default_client: Elephantasm | None = None
+# One async client per event loop: pooled connections are bound to the loop
+# that opened them, so a client must not outlive or cross loops. Each entry
+# holds the client and the async generator that closes it at loop shutdown.
+_default_async_clients: dict[
+    asyncio.AbstractEventLoop, tuple[AsyncElephantasm, AsyncGenerator[None, None]]
+] = {}
+_client_lock = threading.Lock()
 
 
 def _get_client() -> Elephantasm:
@@ -22,10 +35,56 @@ def _get_client() -> Elephantasm:
     """
     global _default_client
     if _default_client is None:
-        _default_client = Elephantasm()
+        with _client_lock:
+            if _default_client is None:
+                client = Elephantasm()
+                if ElephantasmSettings.from_env().warmup:
+                    client.warmup()
+                # Close sockets cleanly on shutdown rather than in a destructor
+                atexit.register(client.close)
+                _default_client = client
     return _default_client
 
 
+async def _close_at_loop_shutdown(
+    loop: asyncio.AbstractEventLoop, client: AsyncElephantasm
+) -> AsyncGenerator[None, None]:
+    """Suspend until the loop finalizes async generators, then close client.
+
+    asyncio.run() and loop.shutdown_asyncgens() close every pending async
+    generator while the loop can still run, which gives the default client a
+    chance to release its connections before the loop goes away.
+    """
+    try:
+        yield
+    finally:
+        _default_async_clients.pop(loop, None)
+        await client.close()
+
+
+async def _get_async_client() -> AsyncElephantasm:
+    """Get or create the default async client for the running event loop.
+
+    The client is closed and forgotten when the loop shuts down its async
+    generators, as asyncio.run() does on exit.
+
+    Returns:
+        Default AsyncElephantasm client configured from environment variables.
+
+    Raises:
+        ValueError: If ELEPHANTASM_API_KEY not set.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _default_async_clients.get(loop)
+    if entry is None:
+        client = AsyncElephantasm()
+        closer = _close_at_loop_shutdown(loop, client)
+        _default_async_clients[loop] = (client, closer)
+        await closer.__anext__()
+        return client
+    return entry[0]
+
+
 def create_anima(
     name: str,
     description: str | None = None,
@@ -77,7 +136,7 @@ def inject(
 
 
 def extract(
-    event_type: str | EventType,
+    event_type: EventTypeStr | str,
     content: str,
     anima_id: str | UUID | None = None,
     session_id: str | None = None,
@@ -121,3 +180,77 @@ def extract(
         meta=meta,
         importance_score=importance_score,
     )
+
+
+async def ainject(
+    anima_id: str | UUID | None = None,
+    query: str | None = None,
+    preset: str | None = None,
+) -> MemoryPack | None:
+    """Async variant of `inject()`.
+
+    Uses the default async client configured from environment variables.
+
+    Args:
+        anima_id: Anima ID. Falls back to ELEPHANTASM_ANIMA_ID.
+        query: Optional query for semantic retrieval.
+        preset: Optional preset name (conversational, self_determined).
+
+    Returns:
+        MemoryPack with context ready for LLM injection, or None if no packs exist.
+
+    Example:
+        >>> from elephantasm import ainject
+        >>> pack = await ainject()
+    """
+    return await (await _get_async_client()).inject(anima_id, query, preset)
+
+
+async def aextract(
+    event_type: EventTypeStr | str,
+    content: str,
+    anima_id: str | UUID | None = None,
+    session_id: str | None = None,
+    role: str | None = None,
+    author: str | None = None,
+    occurred_at: datetime | None = None,
+    meta: dict[str, Any] | None = None,
+    importance_score: float | None = None,
+) -> Event:
+    """Async variant of `extract()`.
+
+    Uses the default async client configured from environment variables.
+
+    Args:
+        event_type: Type of event (e.g., EventType.MESSAGE_IN).
+        content: Event content (message text, tool output, etc.).
+        anima_id: Anima ID. Falls back to ELEPHANTASM_ANIMA_ID.
+        session_id: Optional session identifier for grouping events.
+        role: Message role (user, assistant, system, tool).
+        author: Author identifier (username, model name, tool name).
+        occurred_at: When the event occurred (defaults to now).
+        meta: Optional metadata dictionary.
+        importance_score: Optional importance score (0.0-1.0).
+
+    Returns:
+        Created Event object.
+
+    Example:
+        >>> import asyncio
+        >>> from elephantasm import aextract, EventType
+        >>> await asyncio.gather(
+        ...     aextract(EventType.MESSAGE_IN, "Hello!", role="user"),
+        ...     aextract(EventType.MESSAGE_OUT, "Hi there!", role="assistant"),
+        ... )
+    """
+    return await (await _get_async_client()).extract(
+        event_type=event_type,
+        content=content,
+        anima_id=anima_id,
+        session_id=session_id,
+        role=role,
+        author=author,
+        occurred_at=occurred_at,
+        meta=meta,
+        importance_score=importance_score,
+    )
@@ -1,29 +1,56 @@
 """Pydantic models matching backend API schemas."""
 
+from collections.abc import Mapping
 from datetime import datetime
-from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, Literal, get_args
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SkipValidation, field_validator
 
+EventTypeStr = Literal["message.in", "message.out", "tool.call", "tool.result", "system"]
+"""Valid event_type values accepted by the API."""
 
-class EventType(str, Enum):
-    """Event types for message capture."""
+MemoryStateStr = Literal["active", "decaying", "archived"]
+"""Valid memory lifecycle states."""
 
-    MESSAGE_IN = "message.in"
-    MESSAGE_OUT = "message.out"
-    TOOL_CALL = "tool.call"
-    TOOL_RESULT = "tool.result"
-    SYSTEM = "system"
+_VALID_EVENT_TYPES: frozenset[str] = frozenset(get_args(EventTypeStr))
 
 
-class MemoryState(str, Enum):
+def _validate_event_type(v: str) -> str:
+    """Return v unchanged if it is a canonical event_type value.
+
+    Raises:
+        ValueError: If v is not one of the EventTypeStr values.
+    """
+    if v not in _VALID_EVENT_TYPES:
+        raise ValueError(
+            f"Invalid event_type '{v}'. "
+            f"Valid values: {sorted(_VALID_EVENT_TYPES)}."
+        )
+    return v
+
+
+class EventType:
+    """Event types for message capture.
+
+    Members are plain strings (``EventType.MESSAGE_IN == "message.in"``), so
+    they can be passed anywhere an event_type string is accepted.
+    """
+
+    MESSAGE_IN: EventTypeStr = "message.in"
+    MESSAGE_OUT: EventTypeStr = "message.out"
+    TOOL_CALL: EventTypeStr = "tool.call"
+    TOOL_RESULT: EventTypeStr = "tool.result"
+    SYSTEM: EventTypeStr = "system"
+
+
+class MemoryState:
     """Lifecycle states for memory recall and curation."""
 
-    ACTIVE = "active"
-    DECAYING = "decaying"
-    ARCHIVED = "archived"
+    ACTIVE: MemoryStateStr = "active"
+    DECAYING: MemoryStateStr = "decaying"
+    ARCHIVED: MemoryStateStr = "archived"
 
 
 class Anima(BaseModel):
@@ -85,13 +112,7 @@ class EventCreate(BaseModel):
     @field_validator("event_type")
     @classmethod
     def validate_event_type(cls, v: str) -> str:
-        valid = {"message.in", "message.out", "tool.call", "tool.result", "system"}
-        if v not in valid:
-            raise ValueError(
-                f"Invalid event_type '{v}'. "
-                f"Valid values: {sorted(valid)}."
-            )
-        return v
+        return _validate_event_type(v)
 
 
 class Memory(BaseModel):
@@ -103,7 +124,7 @@ class Memory(BaseModel):
     summary: str | None = None
     importance: float | None = None
     confidence: float | None = None
-    state: MemoryState | None = None
+    state: MemoryStateStr | None = None
     recency_score: float | None = None
     decay_score: float | None = None
     time_start: datetime | None = None
@@ -152,8 +173,22 @@ class IdentityContext(BaseModel):
     prose: str | None = None
 
 
+# MemoryPack accessors whose cached_property values live in the instance __dict__
+_CACHED_ACCESSORS = (
+    "identity",
+    "session_memories",
+    "knowledge",
+    "long_term_memories",
+    "temporal_context",
+)
+
+
 class MemoryPack(BaseModel):
-    """Compiled memory pack for LLM context injection."""
+    """Compiled memory pack for LLM context injection.
+
+    The structured accessors below are parsed from `content` on first access
+    and cached, so `as_prompt()`-only callers never pay for them.
+    """
 
     id: UUID
     anima_id: UUID
@@ -165,10 +200,20 @@ class MemoryPack(BaseModel):
     has_identity: bool = False
     token_count: int = 0
     max_tokens: int = 4000
-    content: dict[str, Any] = Field(default_factory=dict)
+    # Stored by reference: the payload can be large and as_prompt() only reads "context"
+    content: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
     compiled_at: datetime
     created_at: datetime
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "MemoryPack":
+        """Copy the pack, dropping accessors cached from the original's content."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_ACCESSORS:
+            copied.__dict__.pop(name, None)
+        return copied
+
     def as_prompt(self) -> str:
         """Return the formatted context string for LLM injection.
 
@@ -179,7 +224,7 @@ class MemoryPack(BaseModel):
             return ""
         return self.content.get("context", "")
 
-    @property
+    @cached_property
     def identity(self) -> IdentityContext | None:
         """Extract identity context if present."""
         if not self.content:
@@ -189,7 +234,7 @@ class MemoryPack(BaseModel):
             return IdentityContext(**identity_data)
         return None
 
-    @property
+    @cached_property
     def session_memories(self) -> list[ScoredMemory]:
         """Extract session memories with scores."""
         if not self.content:
@@ -197,7 +242,7 @@ class MemoryPack(BaseModel):
         items = self.content.get("session_memories", [])
         return [ScoredMemory(**item) for item in items]
 
-    @property
+    @cached_property
     def knowledge(self) -> list[ScoredKnowledge]:
         """Extract knowledge items with scores."""
         if not self.content:
@@ -205,7 +250,7 @@ class MemoryPack(BaseModel):
         items = self.content.get("knowledge", [])
         return [ScoredKnowledge(**item) for item in items]
 
-    @property
+    @cached_property
     def long_term_memories(self) -> list[ScoredMemory]:
         """Extract long-term memories with scores."""
         if not self.content:
@@ -213,7 +258,7 @@ class MemoryPack(BaseModel):
         items = self.content.get("long_term_memories", [])
         return [ScoredMemory(**item) for item in items]
 
-    @property
+    @cached_property
     def temporal_context(self) -> TemporalContext | None:
         """Extract temporal awareness context if present."""
         if not self.content:
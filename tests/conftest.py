@@ -1,86 +1,123 @@
 """Shared test fixtures and mock setup."""
 
+import itertools
+import json
 from datetime import datetime, timezone
-from uuid import uuid4
 
+import httpx
 import pytest
 import respx
 
 from elephantasm import Elephantasm
 
+_uid_counter = itertools.count(1)
 
-@pytest.fixture
+
+def _uid() -> str:
+    """Unique UUID-formatted ID, cheaper than uuid4() for opaque test IDs."""
+    return f"00000000-0000-0000-0000-{next(_uid_counter):012x}"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register suite-specific command line options."""
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        help="Run exhaustive parameter cross products instead of a covering subset.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    """Retry 429/5xx responses without sleeping between attempts."""
+    monkeypatch.setattr("elephantasm.client._retry_delay", lambda *args: 0.0)
+    monkeypatch.setattr("elephantasm.async_client._retry_delay", lambda *args: 0.0)
+
+
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Test API key."""
     return "sk_test_abc123def456"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anima_id() -> str:
     """Test anima ID."""
-    return str(uuid4())
+    return _uid()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def endpoint() -> str:
     """Test API endpoint."""
     return "https://test.api.elephantasm.com"
 
 
-@pytest.fixture
-def client(api_key: str, anima_id: str, endpoint: str) -> Elephantasm:
-    """Create test client instance."""
-    return Elephantasm(
+@pytest.fixture(scope="session")
+def client(api_key: str, anima_id: str, endpoint: str):
+    """Shared test client instance, closed at the end of the session.
+
+    Tests needing different settings construct their own Elephantasm.
+    """
+    client = Elephantasm(
         api_key=api_key,
         anima_id=anima_id,
         endpoint=endpoint,
     )
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def mock_anima(anima_id: str) -> dict:
-    """Mock anima response."""
-    now = datetime.now(timezone.utc).isoformat()
-    return {
+def _encode(payload: dict) -> bytes:
+    """Serialize a mock response template."""
+    return json.dumps(payload).encode()
+
+
+@pytest.fixture(scope="session")
+def mock_timestamp() -> str:
+    """Timestamp shared by all mock responses."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+@pytest.fixture(scope="session")
+def mock_anima_bytes(anima_id: str, mock_timestamp: str) -> bytes:
+    """Mock anima response, serialized once per session."""
+    return _encode({
         "id": anima_id,
         "name": "Test Anima",
         "description": "A test anima",
         "meta": {"test": True},
-        "user_id": str(uuid4()),
-        "created_at": now,
-        "updated_at": now,
-    }
+        "user_id": _uid(),
+        "created_at": mock_timestamp,
+        "updated_at": mock_timestamp,
+    })
 
 
-@pytest.fixture
-def mock_event(anima_id: str) -> dict:
-    """Mock event response."""
-    now = datetime.now(timezone.utc).isoformat()
-    return {
-        "id": str(uuid4()),
+@pytest.fixture(scope="session")
+def mock_event_bytes(anima_id: str, mock_timestamp: str) -> bytes:
+    """Mock event response, serialized once per session.
+
+    Optional fields are omitted so the models' defaults apply; use
+    `mock_event_full` for a payload with every field set.
+    """
+    return _encode({
+        "id": _uid(),
         "anima_id": anima_id,
         "event_type": "message.in",
         "role": "user",
         "author": "test-user",
-        "summary": None,
         "content": "Hello, world!",
-        "occurred_at": now,
+        "occurred_at": mock_timestamp,
         "session_id": "session-123",
-        "meta": {},
-        "source_uri": None,
-        "dedupe_key": None,
-        "importance_score": None,
-        "created_at": now,
-        "updated_at": now,
-    }
+        "created_at": mock_timestamp,
+        "updated_at": mock_timestamp,
+    })
 
 
-@pytest.fixture
-def mock_memory_pack(anima_id: str) -> dict:
-    """Mock memory pack response."""
-    now = datetime.now(timezone.utc).isoformat()
-    return {
-        "id": str(uuid4()),
+@pytest.fixture(scope="session")
+def mock_memory_pack_bytes(anima_id: str, mock_timestamp: str) -> bytes:
+    """Mock memory pack response, serialized once per session."""
+    return _encode({
+        "id": _uid(),
         "anima_id": anima_id,
         "query": None,
         "preset_name": "conversational",
@@ -100,7 +137,7 @@ def mock_memory_pack(anima_id: str) -> dict:
             },
             "session_memories": [
                 {
-                    "id": str(uuid4()),
+                    "id": _uid(),
                     "summary": "User asked about weather",
                     "score": 0.9,
                     "reason": "Recent and relevant",
@@ -109,7 +146,7 @@ def mock_memory_pack(anima_id: str) -> dict:
             ],
             "knowledge": [
                 {
-                    "id": str(uuid4()),
+                    "id": _uid(),
                     "content": "User prefers concise responses",
                     "type": "preference",
                     "score": 0.85,
@@ -118,7 +155,7 @@ def mock_memory_pack(anima_id: str) -> dict:
             ],
             "long_term_memories": [
                 {
-                    "id": str(uuid4()),
+                    "id": _uid(),
                     "summary": "User works in tech",
                     "score": 0.75,
                     "reason": "Background context",
@@ -127,19 +164,120 @@ def mock_memory_pack(anima_id: str) -> dict:
                 }
             ],
             "temporal_context": {
-                "last_event_at": now,
+                "last_event_at": mock_timestamp,
                 "hours_ago": 2.5,
                 "memory_summary": "discussing project plans",
                 "formatted": "Your last conversation was 2.5 hours ago about project plans.",
             },
         },
-        "compiled_at": now,
-        "created_at": now,
-    }
+        "compiled_at": mock_timestamp,
+        "created_at": mock_timestamp,
+    })
+
+
+@pytest.fixture
+def mock_anima(mock_anima_bytes: bytes) -> dict:
+    """Mock anima response (fresh copy, safe to mutate)."""
+    return json.loads(mock_anima_bytes)
+
+
+@pytest.fixture
+def mock_event(mock_event_bytes: bytes) -> dict:
+    """Mock event response (fresh copy, safe to mutate)."""
+    return json.loads(mock_event_bytes)
 
 
 @pytest.fixture
-def mock_api(endpoint: str):
-    """Context manager for mocking API calls."""
-    with respx.mock(base_url=f"{endpoint}/api") as respx_mock:
+def mock_event_full(mock_event: dict) -> dict:
+    """Mock event response with every optional field populated."""
+    return dict(
+        mock_event,
+        summary="User greeted the assistant",
+        meta={"channel": "web"},
+        source_uri="https://example.com/chat/123",
+        dedupe_key="msg-123",
+        importance_score=0.5,
+    )
+
+
+@pytest.fixture
+def mock_memory_pack(mock_memory_pack_bytes: bytes) -> dict:
+    """Mock memory pack response (fresh copy, safe to mutate)."""
+    return json.loads(mock_memory_pack_bytes)
+
+
+@pytest.fixture(scope="session")
+def mock_transport(
+    anima_id: str,
+    mock_anima_bytes: bytes,
+    mock_event_bytes: bytes,
+    mock_memory_pack_bytes: bytes,
+) -> httpx.MockTransport:
+    """Transport answering the happy-path endpoints from a dispatch table.
+
+    Cheaper than respx for tests that only need a canned success response.
+    """
+    json_headers = {"content-type": "application/json"}
+    routes = {
+        ("GET", f"/api/animas/{anima_id}/memory-packs/latest"): (
+            200,
+            mock_memory_pack_bytes,
+        ),
+        ("POST", "/api/events"): (201, mock_event_bytes),
+        ("POST", "/api/animas"): (201, mock_anima_bytes),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, content = routes[(request.method, request.url.path)]
+        return httpx.Response(status, content=content, headers=json_headers)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(scope="session")
+def transport_client(api_key: str, anima_id: str, endpoint: str, mock_transport):
+    """Shared client wired to `mock_transport` instead of the network."""
+    client = Elephantasm(
+        api_key=api_key,
+        anima_id=anima_id,
+        endpoint=endpoint,
+        transport=mock_transport,
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def mock_api(endpoint: str, anima_id: str):
+    """Router mocking API calls, mounted once for the whole session.
+
+    The common endpoints are registered once as named routes; tests give
+    them a response with e.g. ``mock_api["inject"].mock(return_value=...)``.
+    """
+    with respx.mock(base_url=f"{endpoint}/api", assert_all_called=False) as respx_mock:
+        respx_mock.get(f"/animas/{anima_id}/memory-packs/latest", name="inject")
+        respx_mock.post("/events", name="extract")
+        respx_mock.post("/events/batch", name="extract_many")
+        respx_mock.post("/animas", name="create_anima")
         yield respx_mock
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_api(mock_api):
+    """Check the routes a test mocked, then roll the router back to its base routes.
+
+    Recorded calls are released after every test, so request/response
+    objects never outlive the test that made them.
+    """
+    mock_api.snapshot()
+    yield
+    try:
+        uncalled = [
+            route
+            for route in mock_api.routes
+            if (route.return_value is not None or route.side_effect is not None)
+            and not route.called
+        ]
+        assert not uncalled, f"RESPX: some routes were not called: {uncalled}"
+    finally:
+        mock_api.rollback()
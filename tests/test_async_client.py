@@ -0,0 +1,206 @@
+"""Tests for the AsyncElephantasm client class."""
+
+import asyncio
+import sys
+
+import pytest
+from httpx import Response
+
+from elephantasm import AsyncElephantasm, EventType
+from elephantasm.exceptions import AuthenticationError, NotFoundError, ServerError
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.fixture
+def async_client(api_key: str, anima_id: str, endpoint: str) -> AsyncElephantasm:
+    """Create test async client instance."""
+    return AsyncElephantasm(
+        api_key=api_key,
+        anima_id=anima_id,
+        endpoint=endpoint,
+    )
+
+
+class TestAsyncClientInit:
+    """Tests for async client initialization."""
+
+    def test_init_requires_api_key(self):
+        """Client should raise ValueError if no API key provided."""
+        with pytest.raises(ValueError, match="API key required"):
+            AsyncElephantasm(api_key=None)
+
+    def test_async_context_manager(self, api_key: str):
+        """Client should work as async context manager."""
+
+        async def run():
+            async with AsyncElephantasm(api_key=api_key) as client:
+                assert client.api_key == api_key
+            return client
+
+        client = asyncio.run(run())
+        assert client._client.is_closed
+
+
+class TestAsyncInject:
+    """Tests for the async inject method."""
+
+    def test_inject_success(
+        self, async_client: AsyncElephantasm, mock_api, mock_memory_pack_bytes: bytes
+    ):
+        """inject() should return MemoryPack on success."""
+        mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        pack = asyncio.run(async_client.inject())
+
+        assert pack.session_memory_count == 2
+        assert "memories" in pack.as_prompt().lower()
+
+    def test_inject_returns_none_when_no_packs(self, async_client: AsyncElephantasm, mock_api):
+        """inject() should return None when API returns null."""
+        mock_api["inject"].mock(
+            return_value=Response(
+                200, content=b"null", headers={"content-type": "application/json"}
+            )
+        )
+
+        assert asyncio.run(async_client.inject()) is None
+
+    def test_inject_not_found(self, async_client: AsyncElephantasm, mock_api):
+        """inject() should raise NotFoundError on 404."""
+        mock_api["inject"].mock(
+            return_value=Response(404, json={"detail": "Anima not found"})
+        )
+
+        with pytest.raises(NotFoundError, match="Anima not found"):
+            asyncio.run(async_client.inject())
+
+    def test_inject_lite_returns_prompt(
+        self, async_client: AsyncElephantasm, mock_api, mock_memory_pack: dict
+    ):
+        """inject_lite() should stream out only the prompt string."""
+        mock_api["inject"].mock(
+            return_value=Response(200, json=mock_memory_pack)
+        )
+
+        prompt = asyncio.run(async_client.inject_lite())
+
+        assert prompt == mock_memory_pack["content"]["context"]
+
+    def test_inject_lite_requires_anima_id_before_ijson(
+        self, api_key: str, endpoint: str, monkeypatch
+    ):
+        """A missing anima_id should raise ValueError even without ijson installed."""
+        monkeypatch.delenv("ELEPHANTASM_ANIMA_ID", raising=False)
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        async_client = AsyncElephantasm(api_key=api_key, endpoint=endpoint)
+
+        with pytest.raises(ValueError, match="anima_id required"):
+            asyncio.run(async_client.inject_lite())
+
+
+class TestAsyncExtract:
+    """Tests for the async extract method."""
+
+    def test_extract_success(
+        self, async_client: AsyncElephantasm, mock_api, mock_event_bytes: bytes
+    ):
+        """extract() should return Event on success."""
+        mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+
+        event = asyncio.run(async_client.extract(EventType.MESSAGE_IN, "Hello!"))
+
+        assert event.event_type == "message.in"
+
+    def test_extract_concurrent(
+        self, async_client: AsyncElephantasm, mock_api, mock_event_bytes: bytes
+    ):
+        """extract() calls should run concurrently under asyncio.gather."""
+        route = mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+
+        async def run():
+            return await asyncio.gather(
+                async_client.extract(EventType.MESSAGE_IN, "Hello!", role="user"),
+                async_client.extract(EventType.MESSAGE_OUT, "Hi!", role="assistant"),
+                async_client.extract(EventType.TOOL_CALL, "search()", role="tool"),
+            )
+
+        events = asyncio.run(run())
+
+        assert len(events) == 3
+        assert route.call_count == 3
+
+    def test_extract_invalid_type_raises_locally(self, async_client: AsyncElephantasm):
+        """extract() should raise ValueError for invalid event_type before HTTP call."""
+        with pytest.raises(ValueError, match="Invalid event_type"):
+            asyncio.run(async_client.extract("invalid_type", "Hello!"))
+
+    def test_extract_auth_error(self, async_client: AsyncElephantasm, mock_api):
+        """extract() should raise AuthenticationError on 401."""
+        mock_api["extract"].mock(
+            return_value=Response(401, json={"detail": "Invalid API key"})
+        )
+
+        with pytest.raises(AuthenticationError):
+            asyncio.run(async_client.extract(EventType.MESSAGE_IN, "Hello!"))
+
+
+class TestAsyncCreateAnima:
+    """Tests for the async create_anima method."""
+
+    def test_create_anima_success(
+        self, async_client: AsyncElephantasm, mock_api, mock_anima_bytes: bytes
+    ):
+        """create_anima() should return Anima on success."""
+        mock_api["create_anima"].mock(
+            return_value=Response(201, content=mock_anima_bytes, headers=JSON_HEADERS)
+        )
+
+        anima = asyncio.run(async_client.create_anima(name="Test Anima"))
+
+        assert anima.name == "Test Anima"
+
+
+class TestAsyncRetry:
+    """Tests for transparent retries of 429/5xx responses."""
+
+    def test_retries_server_error_then_succeeds(
+        self, async_client: AsyncElephantasm, mock_api, mock_event_bytes: bytes
+    ):
+        """A transient 503 should be retried transparently."""
+        route = mock_api["extract"].mock(
+            side_effect=[
+                Response(503, json={"detail": "Unavailable"}),
+                Response(201, content=mock_event_bytes, headers=JSON_HEADERS),
+            ]
+        )
+
+        event = asyncio.run(async_client.extract(EventType.MESSAGE_IN, "Hello!"))
+
+        assert event is not None
+        assert route.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, async_client: AsyncElephantasm, mock_api):
+        """Persistent 5xx responses should raise after retry_max_attempts requests."""
+        route = mock_api["extract"].mock(
+            return_value=Response(503, json={"detail": "Unavailable"})
+        )
+
+        with pytest.raises(ServerError):
+            asyncio.run(async_client.extract(EventType.MESSAGE_IN, "Hello!"))
+
+        assert route.call_count == async_client.retry_max_attempts
+
+    def test_zero_attempts_means_single_request(self, api_key: str, endpoint: str):
+        """An explicit retry_max_attempts=0 should not fall back to the default."""
+        async_client = AsyncElephantasm(
+            api_key=api_key, endpoint=endpoint, retry_max_attempts=0
+        )
+
+        assert async_client.retry_max_attempts == 1
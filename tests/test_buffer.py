@@ -0,0 +1,128 @@
+"""Tests for the BufferedExtractor batching helper."""
+
+import json
+import time
+
+import pytest
+from httpx import Response
+
+from elephantasm import BufferedExtractor, Elephantasm, EventType
+from elephantasm.exceptions import AuthenticationError, ElephantasmError
+
+
+class TestBufferedExtractor:
+    """Tests for queued, batched event capture."""
+
+    def test_flushes_on_exit(self, client: Elephantasm, mock_api, mock_event: dict):
+        """Queued events should be sent as one batch when the context exits."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event, mock_event])
+        )
+
+        with BufferedExtractor(client) as buffer:
+            buffer.extract(EventType.MESSAGE_IN, "Hello!", role="user")
+            buffer.extract(EventType.MESSAGE_OUT, "Hi!", role="assistant")
+            assert len(buffer) == 2
+            assert not mock_api.calls
+
+        assert route.call_count == 1
+        assert len(json.loads(route.calls[0].request.content)) == 2
+
+    def test_flushes_at_batch_size(self, client: Elephantasm, mock_api, mock_event: dict):
+        """Reaching batch_size should trigger an immediate flush."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event, mock_event])
+        )
+
+        buffer = BufferedExtractor(client, batch_size=2)
+        buffer.extract(EventType.MESSAGE_IN, "one")
+        assert not mock_api.calls
+        buffer.extract(EventType.MESSAGE_IN, "two")
+
+        assert route.call_count == 1
+        assert len(buffer) == 0
+
+    def test_futures_resolve_to_events(
+        self, client: Elephantasm, mock_api, mock_event: dict
+    ):
+        """extract() should return a Future that resolves when its batch is sent."""
+        mock_api["extract_many"].mock(return_value=Response(201, json=[mock_event]))
+
+        with BufferedExtractor(client) as buffer:
+            future = buffer.extract(EventType.MESSAGE_IN, "Hello!")
+            assert not future.done()
+
+        assert str(future.result().id) == mock_event["id"]
+
+    def test_futures_receive_send_errors(self, client: Elephantasm, mock_api):
+        """A failed batch should set the exception on every queued Future."""
+        mock_api["extract_many"].mock(
+            return_value=Response(401, json={"detail": "Invalid API key"})
+        )
+
+        buffer = BufferedExtractor(client)
+        future = buffer.extract(EventType.MESSAGE_IN, "Hello!")
+        with pytest.raises(AuthenticationError):
+            buffer.close()
+
+        assert isinstance(future.exception(), AuthenticationError)
+
+    def test_short_batch_response_fails_futures(
+        self, client: Elephantasm, mock_api, mock_event: dict
+    ):
+        """A response with fewer events than sent should fail every Future."""
+        mock_api["extract_many"].mock(return_value=Response(201, json=[mock_event]))
+
+        buffer = BufferedExtractor(client)
+        futures = [buffer.extract(EventType.MESSAGE_IN, text) for text in ("one", "two")]
+        with pytest.raises(ElephantasmError, match="1 events for 2 sent"):
+            buffer.close()
+
+        for future in futures:
+            assert isinstance(future.exception(timeout=1), ElephantasmError)
+
+    def test_extract_after_close_raises(self, client: Elephantasm, mock_api):
+        """extract() after close() should raise instead of queuing a lost event."""
+        buffer = BufferedExtractor(client)
+        buffer.close()
+
+        with pytest.raises(RuntimeError, match="after close"):
+            buffer.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert len(buffer) == 0
+
+    def test_flush_interval(self, client: Elephantasm, mock_api, mock_event: dict):
+        """The background thread should flush without waiting for batch_size."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event])
+        )
+
+        buffer = BufferedExtractor(client, flush_interval=0.01)
+        try:
+            buffer.extract(EventType.MESSAGE_IN, "Hello!")
+            deadline = time.monotonic() + 2
+            while not route.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            buffer.close()
+
+        assert route.call_count == 1
+
+    def test_empty_flush_skips_request(self, client: Elephantasm, mock_api):
+        """Closing an empty buffer should not hit the API."""
+        with BufferedExtractor(client):
+            pass
+
+        assert not mock_api.calls
+
+    def test_registers_atexit_flush(self, client: Elephantasm, monkeypatch):
+        """Queued events should be flushed at shutdown until the buffer is closed."""
+        registered = []
+        monkeypatch.setattr("atexit.register", registered.append)
+        monkeypatch.setattr("atexit.unregister", registered.remove)
+
+        buffer = BufferedExtractor(client)
+        assert registered == [buffer.close]
+
+        buffer.close()
+        assert registered == []
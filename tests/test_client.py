@@ -1,16 +1,37 @@
 """Tests for the Elephantasm client class."""
 
+import json
+import sys
+import warnings
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import httpx
+import pydantic
 import pytest
 from httpx import Response
 
-from elephantasm import Elephantasm, EventType
+from elephantasm import Elephantasm, EventCreate, EventType
+from elephantasm.client import _InjectCache, _retry_delay
 from elephantasm.exceptions import (
     AuthenticationError,
+    ElephantasmError,
     NotFoundError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from elephantasm.types import MemoryPack
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.fixture(scope="class")
+def default_client(api_key: str, anima_id: str):
+    """Client built from only an API key and anima ID, shared per class."""
+    client = Elephantasm(api_key=api_key, anima_id=anima_id)
+    yield client
+    client.close()
 
 
 class TestClientInit:
@@ -21,21 +42,26 @@ class TestClientInit:
         with pytest.raises(ValueError, match="API key required"):
             Elephantasm(api_key=None)
 
-    def test_init_with_api_key(self, api_key: str):
+    def test_init_with_api_key(self, default_client: Elephantasm, api_key: str):
         """Client should initialize with valid API key."""
-        client = Elephantasm(api_key=api_key)
-        assert client.api_key == api_key
-        assert client.endpoint == "https://api.elephantasm.com"
+        assert default_client.api_key == api_key
+        assert default_client.endpoint == "https://api.elephantasm.com"
 
-    def test_init_with_custom_endpoint(self, api_key: str, endpoint: str):
+    def test_init_with_custom_endpoint(self, client: Elephantasm, endpoint: str):
         """Client should accept custom endpoint."""
-        client = Elephantasm(api_key=api_key, endpoint=endpoint)
         assert client.endpoint == endpoint
 
-    def test_init_with_anima_id(self, api_key: str, anima_id: str):
+    def test_init_with_anima_id(self, default_client: Elephantasm, anima_id: str):
         """Client should accept default anima_id."""
-        client = Elephantasm(api_key=api_key, anima_id=anima_id)
-        assert client.anima_id == anima_id
+        assert default_client.anima_id == anima_id
+
+    def test_http2_enabled_by_default(self, default_client: Elephantasm):
+        """Client should use HTTP/2 unless opted out."""
+        assert default_client.http2 is True
+
+    def test_http2_opt_out(self, api_key: str):
+        """Client should accept http2=False."""
+        assert Elephantasm(api_key=api_key, http2=False).http2 is False
 
     def test_context_manager(self, api_key: str):
         """Client should work as context manager."""
@@ -43,50 +69,75 @@ class TestClientInit:
             assert client.api_key == api_key
 
 
+class TestWarmup:
+    """Tests for connection warm-up."""
+
+    def test_warmup_sends_health_check(self, client: Elephantasm, mock_api):
+        """warmup() should issue a cheap GET to open the connection."""
+        route = mock_api.get("/health").mock(return_value=Response(200))
+
+        client.warmup()
+
+        assert route.call_count == 1
+
+    def test_warmup_ignores_errors(self, client: Elephantasm, mock_api):
+        """warmup() should never raise on connection failures."""
+        mock_api.get("/health").mock(side_effect=httpx.ConnectError("refused"))
+
+        client.warmup()
+
+
 class TestInject:
     """Tests for the inject method."""
 
-    def test_inject_success(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_memory_pack: dict
-    ):
-        """inject() should return MemoryPack on success."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
-            return_value=Response(200, json=mock_memory_pack)
-        )
-
-        pack = client.inject()
+    def test_inject_success(self, transport_client: Elephantasm):
+        """inject() should return a MemoryPack with working accessors."""
+        pack = transport_client.inject()
 
         assert pack.id is not None
         assert pack.anima_id is not None
         assert pack.session_memory_count == 2
         assert pack.has_identity is True
 
-    def test_inject_as_prompt(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_memory_pack: dict
-    ):
-        """MemoryPack.as_prompt() should return context string."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
-            return_value=Response(200, json=mock_memory_pack)
-        )
+        identity = pack.identity
+        assert identity is not None
+        assert identity.personality_type == "INTJ"
+        assert identity.prose is not None
 
-        pack = client.inject()
+        memories = pack.session_memories
+        assert len(memories) == 1
+        assert memories[0].summary == "User asked about weather"
+        assert memories[0].score == 0.9
+
+    def test_inject_as_prompt(self, transport_client: Elephantasm):
+        """MemoryPack.as_prompt() should return context string."""
+        pack = transport_client.inject()
         prompt = pack.as_prompt()
 
         assert isinstance(prompt, str)
         assert "memories" in prompt.lower()
 
-    def test_inject_with_query(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_memory_pack: dict
-    ):
+    def test_inject_with_query(self, client: Elephantasm, mock_api, mock_memory_pack_bytes: bytes):
         """inject() should pass query parameter."""
-        route = mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
-            return_value=Response(200, json=mock_memory_pack)
+        route = mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
         )
 
         client.inject(query="user preferences")
 
         assert "query=user+preferences" in str(route.calls[0].request.url)
 
+    def test_inject_accepts_uuid(
+        self, client: Elephantasm, mock_api, mock_memory_pack_bytes: bytes
+    ):
+        """inject() should accept a UUID instance as anima_id."""
+        other_id = uuid4()
+        mock_api.get(f"/animas/{other_id}/memory-packs/latest").mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        assert client.inject(anima_id=other_id) is not None
+
     def test_inject_requires_anima_id(self, api_key: str, endpoint: str):
         """inject() should raise ValueError if no anima_id."""
         client = Elephantasm(api_key=api_key, endpoint=endpoint)
@@ -94,11 +145,9 @@ class TestInject:
         with pytest.raises(ValueError, match="anima_id required"):
             client.inject()
 
-    def test_inject_returns_none_when_no_packs(
-        self, client: Elephantasm, anima_id: str, mock_api
-    ):
+    def test_inject_returns_none_when_no_packs(self, client: Elephantasm, mock_api):
         """inject() should return None when API returns null."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
+        mock_api["inject"].mock(
             return_value=Response(
                 200, content=b"null", headers={"content-type": "application/json"}
             )
@@ -107,77 +156,141 @@ class TestInject:
         pack = client.inject()
         assert pack is None
 
-    def test_inject_not_found(self, client: Elephantasm, anima_id: str, mock_api):
+    def test_inject_not_found(self, client: Elephantasm, mock_api):
         """inject() should raise NotFoundError on 404."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
+        mock_api["inject"].mock(
             return_value=Response(404, json={"detail": "Anima not found"})
         )
 
         with pytest.raises(NotFoundError, match="Anima not found"):
             client.inject()
 
-    def test_inject_auth_error(self, client: Elephantasm, anima_id: str, mock_api):
+    def test_inject_auth_error(self, client: Elephantasm, mock_api):
         """inject() should raise AuthenticationError on 401."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
+        mock_api["inject"].mock(
             return_value=Response(401, json={"detail": "Invalid API key"})
         )
 
         with pytest.raises(AuthenticationError, match="Invalid API key"):
             client.inject()
 
-    def test_inject_identity_accessor(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_memory_pack: dict
+    def test_inject_accessors_cached(self, transport_client: Elephantasm):
+        """MemoryPack accessors should parse content once and reuse the result."""
+        pack = transport_client.inject()
+
+        assert pack.session_memories is pack.session_memories
+        assert pack.knowledge is pack.knowledge
+        assert pack.identity is pack.identity
+
+    def test_model_copy_reparses_accessors(self, transport_client: Elephantasm):
+        """model_copy(update=...) should not reuse accessors cached from old content."""
+        pack = transport_client.inject()
+        memories = pack.session_memories
+        assert memories
+        assert pack.identity is not None
+
+        copy = pack.model_copy(update={"content": {"context": "Replaced"}})
+
+        assert copy.session_memories == []
+        assert copy.identity is None
+        assert pack.session_memories is memories
+
+
+class TestInjectLite:
+    """Tests for the streaming inject_lite method."""
+
+    def test_inject_lite_returns_prompt(
+        self, client: Elephantasm, mock_api, mock_memory_pack: dict
     ):
-        """MemoryPack.identity should return IdentityContext."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
+        """inject_lite() should return the same string as inject().as_prompt()."""
+        mock_api["inject"].mock(
             return_value=Response(200, json=mock_memory_pack)
         )
 
-        pack = client.inject()
-        identity = pack.identity
+        assert client.inject_lite() == mock_memory_pack["content"]["context"]
 
-        assert identity is not None
-        assert identity.personality_type == "INTJ"
-        assert identity.prose is not None
+    def test_inject_lite_passes_query(
+        self, client: Elephantasm, mock_api, mock_memory_pack_bytes: bytes
+    ):
+        """inject_lite() should send query and preset parameters."""
+        route = mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
 
-    def test_inject_session_memories_accessor(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_memory_pack: dict
+        client.inject_lite(query="weather", preset="conversational")
+
+        url = str(route.calls[0].request.url)
+        assert "query=weather" in url
+        assert "preset=conversational" in url
+
+    def test_inject_lite_none_when_no_packs(self, client: Elephantasm, mock_api):
+        """inject_lite() should return None when the API returns null."""
+        mock_api["inject"].mock(
+            return_value=Response(
+                200, content=b"null", headers={"content-type": "application/json"}
+            )
+        )
+
+        assert client.inject_lite() is None
+
+    def test_inject_lite_empty_without_context(
+        self, client: Elephantasm, mock_api, mock_memory_pack: dict
     ):
-        """MemoryPack.session_memories should return list of ScoredMemory."""
-        mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
+        """inject_lite() should return an empty string when the pack has no context."""
+        mock_memory_pack["content"] = {}
+        mock_api["inject"].mock(
             return_value=Response(200, json=mock_memory_pack)
         )
 
-        pack = client.inject()
-        memories = pack.session_memories
+        assert client.inject_lite() == ""
 
-        assert len(memories) == 1
-        assert memories[0].summary == "User asked about weather"
-        assert memories[0].score == 0.9
+    def test_inject_lite_null_context_matches_inject(
+        self, client: Elephantasm, mock_api, mock_memory_pack: dict
+    ):
+        """inject_lite() should return None, like as_prompt(), for a null context."""
+        mock_memory_pack["content"]["context"] = None
+        mock_api["inject"].mock(
+            return_value=Response(200, json=mock_memory_pack)
+        )
+
+        assert client.inject_lite() is None
+        assert client.inject().as_prompt() is None
+
+    def test_inject_lite_requires_anima_id_before_ijson(
+        self, api_key: str, endpoint: str, monkeypatch
+    ):
+        """A missing anima_id should raise ValueError even without ijson installed."""
+        monkeypatch.delenv("ELEPHANTASM_ANIMA_ID", raising=False)
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        client = Elephantasm(api_key=api_key, endpoint=endpoint)
+
+        with pytest.raises(ValueError, match="anima_id required"):
+            client.inject_lite()
+
+    def test_inject_lite_not_found(self, client: Elephantasm, mock_api):
+        """inject_lite() should raise NotFoundError on 404."""
+        mock_api["inject"].mock(
+            return_value=Response(404, json={"detail": "Anima not found"})
+        )
+
+        with pytest.raises(NotFoundError, match="Anima not found"):
+            client.inject_lite()
 
 
 class TestExtract:
     """Tests for the extract method."""
 
-    def test_extract_success(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_event: dict
-    ):
+    def test_extract_success(self, transport_client: Elephantasm):
         """extract() should return Event on success."""
-        mock_api.post("/events").mock(return_value=Response(201, json=mock_event))
-
-        event = client.extract(EventType.MESSAGE_IN, "Hello!")
+        event = transport_client.extract(EventType.MESSAGE_IN, "Hello!")
 
         assert event.id is not None
         assert event.event_type == "message.in"
         assert event.content == "Hello, world!"
 
-    def test_extract_with_all_params(
-        self, client: Elephantasm, anima_id: str, mock_api, mock_event: dict
-    ):
+    def test_extract_with_all_params(self, transport_client: Elephantasm):
         """extract() should accept all optional parameters."""
-        mock_api.post("/events").mock(return_value=Response(201, json=mock_event))
-
-        event = client.extract(
+        event = transport_client.extract(
             event_type=EventType.MESSAGE_IN,
             content="Hello!",
             session_id="session-123",
@@ -189,6 +302,28 @@ class TestExtract:
 
         assert event is not None
 
+    def test_extract_payload(
+        self, client: Elephantasm, anima_id: str, mock_api, mock_event_bytes: bytes
+    ):
+        """extract() should send only the provided fields as JSON."""
+        route = mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+        occurred_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        client.extract(
+            EventType.TOOL_CALL, "search()", role="tool", occurred_at=occurred_at
+        )
+
+        assert json.loads(route.calls[0].request.content) == {
+            "anima_id": anima_id,
+            "event_type": "tool.call",
+            "content": "search()",
+            "meta": {},
+            "role": "tool",
+            "occurred_at": "2025-01-02T03:04:05+00:00",
+        }
+
     def test_extract_requires_anima_id(self, api_key: str, endpoint: str):
         """extract() should raise ValueError if no anima_id."""
         client = Elephantasm(api_key=api_key, endpoint=endpoint)
@@ -198,7 +333,7 @@ class TestExtract:
 
     def test_extract_auth_error(self, client: Elephantasm, mock_api):
         """extract() should raise AuthenticationError on 401."""
-        mock_api.post("/events").mock(
+        mock_api["extract"].mock(
             return_value=Response(401, json={"detail": "Invalid API key"})
         )
 
@@ -207,7 +342,7 @@ class TestExtract:
 
     def test_extract_rate_limit(self, client: Elephantasm, mock_api):
         """extract() should raise RateLimitError on 429."""
-        mock_api.post("/events").mock(
+        mock_api["extract"].mock(
             return_value=Response(429, json={"detail": "Rate limit exceeded"})
         )
 
@@ -221,7 +356,7 @@ class TestExtract:
 
     def test_extract_server_validation_error(self, client: Elephantasm, mock_api):
         """extract() should raise ValidationError on 422 from server."""
-        mock_api.post("/events").mock(
+        mock_api["extract"].mock(
             return_value=Response(422, json={"detail": "Invalid event_type"})
         )
 
@@ -230,36 +365,112 @@ class TestExtract:
 
     def test_extract_server_error(self, client: Elephantasm, mock_api):
         """extract() should raise ServerError on 5xx."""
-        mock_api.post("/events").mock(
+        mock_api["extract"].mock(
             return_value=Response(500, json={"detail": "Internal error"})
         )
 
         with pytest.raises(ServerError):
             client.extract(EventType.MESSAGE_IN, "Hello!")
 
+    def test_extract_unmapped_error(self, client: Elephantasm, mock_api):
+        """Unmapped 4xx responses should raise the base ElephantasmError."""
+        mock_api["extract"].mock(
+            return_value=Response(400, json={"detail": "Bad request"})
+        )
+
+        with pytest.raises(ElephantasmError, match="Bad request") as info:
+            client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert type(info.value) is ElephantasmError
+        assert info.value.status_code == 400
+
+    def test_extract_non_json_error_body(self, client: Elephantasm, mock_api):
+        """Non-JSON error bodies should be surfaced as the error message."""
+        mock_api["extract"].mock(return_value=Response(502, text="Bad Gateway"))
+
+        with pytest.raises(ServerError, match="Bad Gateway"):
+            client.extract(EventType.MESSAGE_IN, "Hello!")
+
+
+class TestResponseValidation:
+    """Tests for response model construction."""
+
+    def test_default_responses_parse_uuid_and_datetime(
+        self, transport_client: Elephantasm, mock_event: dict
+    ):
+        """By default UUID and datetime fields should still hold typed values."""
+        event = transport_client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event.id == UUID(mock_event["id"])
+        assert event.created_at == datetime.fromisoformat(mock_event["created_at"])
+
+    def test_default_responses_serialize_without_warnings(
+        self, transport_client: Elephantasm
+    ):
+        """model_dump_json() on a non-strict response should not warn."""
+        event = transport_client.extract(EventType.MESSAGE_IN, "Hello!")
+        pack = transport_client.inject()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            event.model_dump_json()
+            pack.model_dump_json()
+
+    def test_malformed_field_falls_back_to_validation(
+        self, client: Elephantasm, mock_api, mock_event: dict
+    ):
+        """An unparseable field should raise pydantic's validation error."""
+        mock_event["created_at"] = "yesterday"
+        mock_api["extract"].mock(return_value=Response(201, json=mock_event))
+
+        with pytest.raises(pydantic.ValidationError, match="created_at"):
+            client.extract(EventType.MESSAGE_IN, "Hello!")
+
+    def test_omitted_fields_use_defaults(
+        self, client: Elephantasm, mock_api, mock_event_bytes: bytes
+    ):
+        """Optional fields missing from a response should take the model defaults."""
+        mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+
+        event = client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event.meta == {}
+        assert event.summary is None
+        assert event.importance_score is None
+
+    def test_strict_validates_responses(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api, mock_event_full: dict
+    ):
+        """strict=True should validate responses into typed fields."""
+        client = Elephantasm(
+            api_key=api_key, anima_id=anima_id, endpoint=endpoint, strict=True
+        )
+        mock_api["extract"].mock(return_value=Response(201, json=mock_event_full))
+
+        event = client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event.id == UUID(mock_event_full["id"])
+        assert isinstance(event.created_at, datetime)
+        assert event.meta == {"channel": "web"}
+        assert event.importance_score == 0.5
+
 
 class TestCreateAnima:
     """Tests for the create_anima method."""
 
-    def test_create_anima_success(
-        self, client: Elephantasm, mock_api, mock_anima: dict
-    ):
+    def test_create_anima_success(self, transport_client: Elephantasm):
         """create_anima() should return Anima on success."""
-        mock_api.post("/animas").mock(return_value=Response(201, json=mock_anima))
-
-        anima = client.create_anima(name="Test Anima", description="A test anima")
+        anima = transport_client.create_anima(name="Test Anima", description="A test anima")
 
         assert anima.id is not None
         assert anima.name == "Test Anima"
         assert anima.description == "A test anima"
 
-    def test_create_anima_with_meta(
-        self, client: Elephantasm, mock_api, mock_anima: dict
-    ):
+    def test_create_anima_with_meta(self, transport_client: Elephantasm):
         """create_anima() should accept meta parameter."""
-        mock_api.post("/animas").mock(return_value=Response(201, json=mock_anima))
-
-        anima = client.create_anima(
+        anima = transport_client.create_anima(
             name="Test Anima",
             meta={"environment": "production"},
         )
@@ -268,9 +479,312 @@ class TestCreateAnima:
 
     def test_create_anima_auth_error(self, client: Elephantasm, mock_api):
         """create_anima() should raise AuthenticationError on 401."""
-        mock_api.post("/animas").mock(
+        mock_api["create_anima"].mock(
             return_value=Response(401, json={"detail": "Invalid API key"})
         )
 
         with pytest.raises(AuthenticationError):
             client.create_anima(name="Test")
+
+
+class TestExtractMany:
+    """Tests for the extract_many method."""
+
+    def test_extract_many_success(
+        self, client: Elephantasm, anima_id: str, mock_api, mock_event: dict
+    ):
+        """extract_many() should POST one batch and return all Events."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event, mock_event])
+        )
+
+        events = client.extract_many([
+            {"event_type": EventType.MESSAGE_IN, "content": "Hello!", "role": "user"},
+            EventCreate(anima_id=anima_id, event_type="message.out", content="Hi!"),
+        ])
+
+        assert len(events) == 2
+        assert route.call_count == 1
+        payload = json.loads(route.calls[0].request.content)
+        assert [p["event_type"] for p in payload] == ["message.in", "message.out"]
+        assert all(p["anima_id"] == anima_id for p in payload)
+
+    def test_extract_many_serializes_event_create(
+        self, client: Elephantasm, anima_id: str, mock_api, mock_event: dict
+    ):
+        """EventCreate UUID and datetime fields should serialize to JSON strings."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event])
+        )
+        occurred_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        client.extract_many([
+            EventCreate(
+                anima_id=anima_id,
+                event_type="system",
+                content="boot",
+                occurred_at=occurred_at,
+            ),
+        ])
+
+        payload = json.loads(route.calls[0].request.content)[0]
+        assert payload["anima_id"] == anima_id
+        assert payload["occurred_at"] == "2025-01-02T03:04:05+00:00"
+        assert "session_id" not in payload
+
+    def test_extract_many_empty_skips_request(self, client: Elephantasm, mock_api):
+        """extract_many() should not hit the API for an empty list."""
+        assert client.extract_many([]) == []
+        assert not mock_api.calls
+
+    def test_extract_many_invalid_type_raises_locally(self, client: Elephantasm):
+        """extract_many() should validate event types before sending."""
+        with pytest.raises(ValueError, match="Invalid event_type"):
+            client.extract_many([{"event_type": "bogus", "content": "Hello!"}])
+
+
+class TestRetry:
+    """Tests for transparent retries of 429/5xx responses."""
+
+    def test_retries_server_error_then_succeeds(
+        self, client: Elephantasm, mock_api, mock_event_bytes: bytes
+    ):
+        """A transient 503 should be retried transparently."""
+        route = mock_api["extract"].mock(
+            side_effect=[
+                Response(503, json={"detail": "Unavailable"}),
+                Response(201, content=mock_event_bytes, headers=JSON_HEADERS),
+            ]
+        )
+
+        event = client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event is not None
+        assert route.call_count == 2
+
+    def test_gives_up_after_max_attempts(self, client: Elephantasm, mock_api):
+        """Persistent 429s should raise after retry_max_attempts requests."""
+        route = mock_api["extract"].mock(
+            return_value=Response(429, json={"detail": "Rate limit exceeded"})
+        )
+
+        with pytest.raises(RateLimitError):
+            client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert route.call_count == client.retry_max_attempts
+
+    def test_client_errors_not_retried(self, client: Elephantasm, mock_api):
+        """4xx responses other than 429 should fail immediately."""
+        route = mock_api["inject"].mock(
+            return_value=Response(404, json={"detail": "Anima not found"})
+        )
+
+        with pytest.raises(NotFoundError):
+            client.inject()
+
+        assert route.call_count == 1
+
+    def test_retry_disabled(self, api_key: str, endpoint: str, mock_api):
+        """retry_max_attempts=1 should send a single request."""
+        client = Elephantasm(api_key=api_key, endpoint=endpoint, retry_max_attempts=1)
+        route = mock_api["create_anima"].mock(
+            return_value=Response(500, json={"detail": "Internal error"})
+        )
+
+        with pytest.raises(ServerError):
+            client.create_anima(name="Test")
+
+        assert route.call_count == 1
+
+    def test_zero_attempts_means_single_request(self, api_key: str, endpoint: str):
+        """An explicit retry_max_attempts=0 should not fall back to the default."""
+        client = Elephantasm(api_key=api_key, endpoint=endpoint, retry_max_attempts=0)
+
+        assert client.retry_max_attempts == 1
+
+
+class TestRetryDelay:
+    """Tests for the backoff delay calculation."""
+
+    def test_honors_retry_after(self):
+        """A numeric Retry-After header should set the delay."""
+        response = Response(429, headers={"Retry-After": "1.5"})
+        assert _retry_delay(response, 1, 0.2) == 1.5
+
+    def test_retry_after_capped(self):
+        """Retry-After should not block for longer than the cap."""
+        response = Response(429, headers={"Retry-After": "120"})
+        assert _retry_delay(response, 1, 0.2) == 4.0
+
+    def test_exponential_backoff_with_jitter(self):
+        """Without Retry-After the delay should stay within the backoff window."""
+        response = Response(503)
+        for attempt in range(1, 8):
+            delay = _retry_delay(response, attempt, 0.2)
+            assert 0 <= delay <= min(4.0, 0.2 * 2 ** (attempt - 1))
+
+
+class TestInjectCache:
+    """Tests for the opt-in inject() TTL cache."""
+
+    def test_cache_disabled_by_default(
+        self, client: Elephantasm, mock_api, mock_memory_pack_bytes: bytes
+    ):
+        """Without inject_cache_ttl every inject() should hit the API."""
+        route = mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        client.inject()
+        client.inject()
+
+        assert route.call_count == 2
+
+    def test_cache_reuses_pack(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api, mock_memory_pack_bytes: bytes
+    ):
+        """Identical inject() calls within the TTL should share one request."""
+        client = Elephantasm(
+            api_key=api_key, anima_id=anima_id, endpoint=endpoint, inject_cache_ttl=60
+        )
+        route = mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        first = client.inject(query="weather")
+        second = client.inject(query="weather")
+        client.inject(query="other")
+
+        assert first is second
+        assert route.call_count == 2
+
+    def test_cache_expires(self, mock_memory_pack: dict, monkeypatch):
+        """Entries older than the TTL should be dropped."""
+        now = [100.0]
+        monkeypatch.setattr("elephantasm.client.time.monotonic", lambda: now[0])
+        cache = _InjectCache(ttl=1.0)
+        pack = MemoryPack(**mock_memory_pack)
+
+        cache.put(("a", None, None), pack)
+        assert cache.get(("a", None, None)) is pack
+        now[0] += 1.0
+        assert cache.get(("a", None, None)) is None
+
+    def test_cache_evicts_least_recently_used(self, mock_memory_pack: dict):
+        """The cache should hold at most maxsize entries."""
+        cache = _InjectCache(ttl=60, maxsize=2)
+        pack = MemoryPack(**mock_memory_pack)
+
+        cache.put(("a",), pack)
+        cache.put(("b",), pack)
+        cache.get(("a",))
+        cache.put(("c",), pack)
+
+        assert cache.get(("a",)) is pack
+        assert cache.get(("b",)) is None
+
+
+class TestBackgroundExtract:
+    """Tests for background_extract=True."""
+
+    def test_submit_extract_returns_future(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api, mock_event: dict
+    ):
+        """submit_extract() should queue the event and resolve the Future once batched."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event, mock_event])
+        )
+        client = Elephantasm(
+            api_key=api_key,
+            anima_id=anima_id,
+            endpoint=endpoint,
+            background_extract=True,
+            batch_size=2,
+            flush_interval=60,
+        )
+        try:
+            first = client.submit_extract(EventType.MESSAGE_IN, "Hello!")
+            second = client.submit_extract(EventType.MESSAGE_OUT, "Hi!")
+
+            assert first.result(timeout=2).event_type == "message.in"
+            assert second.result(timeout=2).event_type == "message.in"
+        finally:
+            client.close()
+
+        assert route.call_count == 1
+
+    def test_close_drains_queue(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api, mock_event: dict
+    ):
+        """close() should send events still waiting in the queue."""
+        route = mock_api["extract_many"].mock(
+            return_value=Response(201, json=[mock_event])
+        )
+        client = Elephantasm(
+            api_key=api_key,
+            anima_id=anima_id,
+            endpoint=endpoint,
+            background_extract=True,
+            flush_interval=60,
+        )
+
+        pending = client.submit_extract(EventType.MESSAGE_IN, "Hello!")
+        assert not pending.done()
+        client.close()
+
+        assert route.call_count == 1
+        assert pending.result().event_type == "message.in"
+
+    def test_extract_still_blocks(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api, mock_event_bytes: bytes
+    ):
+        """extract() should keep returning the Event when background_extract is on."""
+        mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+        with Elephantasm(
+            api_key=api_key, anima_id=anima_id, endpoint=endpoint, background_extract=True
+        ) as client:
+            event = client.extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event.event_type == "message.in"
+
+    def test_submit_extract_requires_background(self, client: Elephantasm):
+        """submit_extract() should raise ValueError without background_extract."""
+        with pytest.raises(ValueError, match="background_extract=True"):
+            client.submit_extract(EventType.MESSAGE_IN, "Hello!")
+
+    def test_submit_extract_after_close_raises(
+        self, api_key: str, anima_id: str, endpoint: str
+    ):
+        """submit_extract() after close() should raise instead of hanging a Future."""
+        client = Elephantasm(
+            api_key=api_key, anima_id=anima_id, endpoint=endpoint, background_extract=True
+        )
+        client.close()
+
+        with pytest.raises(RuntimeError, match="after close"):
+            client.submit_extract(EventType.MESSAGE_IN, "Hello!")
+
+    def test_close_releases_client_when_flush_fails(
+        self, api_key: str, anima_id: str, endpoint: str, mock_api
+    ):
+        """close() should close the HTTP client even if the final flush fails."""
+        mock_api["extract_many"].mock(
+            return_value=Response(401, json={"detail": "Invalid API key"})
+        )
+        client = Elephantasm(
+            api_key=api_key,
+            anima_id=anima_id,
+            endpoint=endpoint,
+            background_extract=True,
+            flush_interval=60,
+        )
+        pending = client.submit_extract(EventType.MESSAGE_IN, "Hello!")
+
+        with pytest.raises(AuthenticationError):
+            with client:
+                pass
+
+        assert client._client.is_closed
+        assert isinstance(pending.exception(), AuthenticationError)
@@ -0,0 +1,58 @@
+"""Tests for environment-based configuration."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from elephantasm.config import ElephantasmSettings
+
+
+class TestSettingsFromEnv:
+    """Tests for ElephantasmSettings.from_env()."""
+
+    def test_defaults(self, monkeypatch):
+        """Unset variables should fall back to defaults."""
+        for name in ("API_KEY", "ENDPOINT", "TIMEOUT", "HTTP2", "STRICT"):
+            monkeypatch.delenv(f"ELEPHANTASM_{name}", raising=False)
+
+        settings = ElephantasmSettings.from_env()
+
+        assert settings.api_key is None
+        assert settings.endpoint == "https://api.elephantasm.com"
+        assert settings.timeout == 30
+        assert settings.http2 is True
+        assert settings.strict is False
+
+    def test_reads_and_parses_values(self, monkeypatch):
+        """Variables should be parsed into their field types."""
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", "sk_test")
+        monkeypatch.setenv("ELEPHANTASM_TIMEOUT", "5")
+        monkeypatch.setenv("ELEPHANTASM_RETRY_BASE", "0.5")
+        monkeypatch.setenv("ELEPHANTASM_HTTP2", "false")
+        monkeypatch.setenv("ELEPHANTASM_STRICT", "TRUE")
+        monkeypatch.setenv("ELEPHANTASM_WARMUP", "1")
+
+        settings = ElephantasmSettings.from_env()
+
+        assert settings.api_key == "sk_test"
+        assert settings.timeout == 5
+        assert settings.retry_base == 0.5
+        assert settings.http2 is False
+        assert settings.strict is True
+        assert settings.warmup is True
+
+    def test_invalid_number_raises(self, monkeypatch):
+        """A non-numeric timeout should raise ValueError."""
+        monkeypatch.setenv("ELEPHANTASM_TIMEOUT", "soon")
+
+        with pytest.raises(ValueError):
+            ElephantasmSettings.from_env()
+
+    def test_import_does_not_read_env(self):
+        """A bad variable should only fail when settings are built, not at import."""
+        env = {**os.environ, "ELEPHANTASM_TIMEOUT": "soon"}
+        subprocess.run(
+            [sys.executable, "-c", "import elephantasm.client"], check=True, env=env
+        )
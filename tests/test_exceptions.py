@@ -0,0 +1,57 @@
+"""Tests for the exception hierarchy."""
+
+import pickle
+
+import pytest
+
+from elephantasm.exceptions import (
+    AuthenticationError,
+    ElephantasmError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+
+class TestExceptions:
+    """Tests for exception attributes and behavior."""
+
+    @pytest.mark.parametrize(
+        "exc_cls,status_code",
+        [
+            (AuthenticationError, 401),
+            (NotFoundError, 404),
+            (ValidationError, 422),
+            (RateLimitError, 429),
+            (ServerError, 500),
+        ],
+    )
+    def test_status_codes(self, exc_cls: type, status_code: int):
+        """Each subclass should carry its HTTP status code."""
+        with pytest.raises(ElephantasmError, match="boom") as info:
+            raise exc_cls("boom")
+
+        assert info.value.status_code == status_code
+        assert info.value.message == "boom"
+        assert str(info.value) == "boom"
+
+    def test_slots(self):
+        """Attributes should live in slots rather than an instance dict."""
+        assert ElephantasmError.__slots__ == ("message", "status_code")
+        assert RateLimitError.__slots__ == ()
+
+    def test_pickle_roundtrip(self):
+        """Pickling should preserve message and status_code."""
+        err = pickle.loads(pickle.dumps(ElephantasmError("teapot", status_code=418)))
+
+        assert err.message == "teapot"
+        assert err.status_code == 418
+        assert str(err) == "teapot"
+
+    def test_subclass_pickle_roundtrip(self):
+        """Subclasses should unpickle to the same type."""
+        err = pickle.loads(pickle.dumps(NotFoundError("gone")))
+
+        assert isinstance(err, NotFoundError)
+        assert err.status_code == 404
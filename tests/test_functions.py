@@ -1,174 +1,217 @@
 """Tests for module-level convenience functions."""
 
-import os
-from unittest.mock import patch
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
 
 import pytest
-import respx
 from httpx import Response
 
-from elephantasm import EventType
+import elephantasm.functions as fn
+from elephantasm import EventType, ainject, create_anima, extract, inject
 
+JSON_HEADERS = {"content-type": "application/json"}
 
+
+@pytest.fixture
+def local_server(mock_memory_pack_bytes: bytes):
+    """Real keep-alive HTTP server answering every GET with the mock memory pack."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(mock_memory_pack_bytes)))
+            self.end_headers()
+            self.wfile.write(mock_memory_pack_bytes)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.serial
+@pytest.mark.xdist_group("module_functions")
 class TestModuleFunctions:
     """Tests for inject(), extract(), create_anima() module functions."""
 
     @pytest.fixture(autouse=True)
-    def reset_modules(self):
-        """Reset the config and functions modules before each test."""
-        # Clear cached modules to force reload with new env vars
-        import sys
-        modules_to_clear = [
-            "elephantasm",
-            "elephantasm.config",
-            "elephantasm.client",
-            "elephantasm.functions",
-            "elephantasm.types",
-            "elephantasm.exceptions",
-        ]
-        for mod in modules_to_clear:
-            if mod in sys.modules:
-                del sys.modules[mod]
+    def reset_default_clients(self):
+        """Drop the default clients a test created so the next one starts fresh.
+
+        Nothing else creates them, so resetting on teardown alone is enough.
+        """
         yield
-        # Cleanup after test
-        for mod in modules_to_clear:
-            if mod in sys.modules:
-                del sys.modules[mod]
+        if fn._default_client is not None:
+            fn._default_client.close()
+        fn._default_client = None
+        for client, _ in list(fn._default_async_clients.values()):
+            asyncio.run(client.close())
+        fn._default_async_clients.clear()
 
     def test_inject_uses_default_client(
-        self, api_key: str, anima_id: str, endpoint: str, mock_memory_pack: dict
+        self, api_key: str, anima_id: str, endpoint: str, mock_memory_pack_bytes: bytes,
+        mock_api, monkeypatch,
     ):
         """inject() should use lazy default client from env vars."""
-        with patch.dict(
-            os.environ,
-            {
-                "ELEPHANTASM_API_KEY": api_key,
-                "ELEPHANTASM_ANIMA_ID": anima_id,
-                "ELEPHANTASM_ENDPOINT": endpoint,
-            },
-            clear=False,
-        ):
-            # Import after patching env
-            from elephantasm import inject
-
-            with respx.mock(base_url=f"{endpoint}/api") as mock_api:
-                mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
-                    return_value=Response(200, json=mock_memory_pack)
-                )
-
-                pack = inject()
-
-                assert pack is not None
-                assert pack.session_memory_count == 2
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", anima_id)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        pack = inject()
+
+        assert pack is not None
+        assert pack.session_memory_count == 2
 
     def test_extract_uses_default_client(
-        self, api_key: str, anima_id: str, endpoint: str, mock_event: dict
+        self, api_key: str, anima_id: str, endpoint: str, mock_event_bytes: bytes,
+        mock_api, monkeypatch,
     ):
         """extract() should use lazy default client from env vars."""
-        with patch.dict(
-            os.environ,
-            {
-                "ELEPHANTASM_API_KEY": api_key,
-                "ELEPHANTASM_ANIMA_ID": anima_id,
-                "ELEPHANTASM_ENDPOINT": endpoint,
-            },
-            clear=False,
-        ):
-            # Import after patching env
-            from elephantasm import extract
-
-            with respx.mock(base_url=f"{endpoint}/api") as mock_api:
-                mock_api.post("/events").mock(
-                    return_value=Response(201, json=mock_event)
-                )
-
-                event = extract(EventType.MESSAGE_IN, "Hello!")
-
-                assert event is not None
-                assert event.event_type == "message.in"
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", anima_id)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        mock_api["extract"].mock(
+            return_value=Response(201, content=mock_event_bytes, headers=JSON_HEADERS)
+        )
+
+        event = extract(EventType.MESSAGE_IN, "Hello!")
+
+        assert event is not None
+        assert event.event_type == "message.in"
 
     def test_create_anima_uses_default_client(
-        self, api_key: str, endpoint: str, mock_anima: dict
+        self, api_key: str, endpoint: str, mock_anima_bytes: bytes, mock_api, monkeypatch
     ):
         """create_anima() should use lazy default client from env vars."""
-        with patch.dict(
-            os.environ,
-            {
-                "ELEPHANTASM_API_KEY": api_key,
-                "ELEPHANTASM_ENDPOINT": endpoint,
-            },
-            clear=False,
-        ):
-            # Import after patching env
-            from elephantasm import create_anima
-
-            with respx.mock(base_url=f"{endpoint}/api") as mock_api:
-                mock_api.post("/animas").mock(
-                    return_value=Response(201, json=mock_anima)
-                )
-
-                anima = create_anima(name="Test Anima")
-
-                assert anima is not None
-                assert anima.name == "Test Anima"
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        mock_api["create_anima"].mock(
+            return_value=Response(201, content=mock_anima_bytes, headers=JSON_HEADERS)
+        )
+
+        anima = create_anima(name="Test Anima")
+
+        assert anima is not None
+        assert anima.name == "Test Anima"
 
     def test_default_client_reused(
-        self, api_key: str, anima_id: str, endpoint: str, mock_memory_pack: dict
+        self, api_key: str, anima_id: str, endpoint: str, mock_memory_pack_bytes: bytes,
+        mock_api, monkeypatch,
     ):
         """Default client should be reused across calls."""
-        with patch.dict(
-            os.environ,
-            {
-                "ELEPHANTASM_API_KEY": api_key,
-                "ELEPHANTASM_ANIMA_ID": anima_id,
-                "ELEPHANTASM_ENDPOINT": endpoint,
-            },
-            clear=False,
-        ):
-            # Import after patching env
-            from elephantasm import functions as fn
-            from elephantasm import inject
-
-            with respx.mock(base_url=f"{endpoint}/api") as mock_api:
-                mock_api.get(f"/animas/{anima_id}/memory-packs/latest").mock(
-                    return_value=Response(200, json=mock_memory_pack)
-                )
-
-                # First call creates client
-                inject()
-                client1 = fn._default_client
-
-                # Second call reuses client
-                inject()
-                client2 = fn._default_client
-
-                assert client1 is client2
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", anima_id)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        mock_api["inject"].mock(
+            return_value=Response(200, content=mock_memory_pack_bytes, headers=JSON_HEADERS)
+        )
+
+        # First call creates client
+        inject()
+        client1 = fn._default_client
+
+        # Second call reuses client
+        inject()
+        client2 = fn._default_client
+
+        assert client1 is client2
 
     def test_inject_with_explicit_anima_id(
-        self, api_key: str, endpoint: str, mock_memory_pack: dict
+        self, api_key: str, endpoint: str, mock_memory_pack: dict, mock_api, monkeypatch
     ):
         """inject() should accept explicit anima_id override."""
-        from uuid import uuid4
         explicit_anima_id = str(uuid4())
         mock_memory_pack["anima_id"] = explicit_anima_id
 
-        with patch.dict(
-            os.environ,
-            {
-                "ELEPHANTASM_API_KEY": api_key,
-                "ELEPHANTASM_ANIMA_ID": "default-anima-id",
-                "ELEPHANTASM_ENDPOINT": endpoint,
-            },
-            clear=False,
-        ):
-            # Import after patching env
-            from elephantasm import inject
-
-            with respx.mock(base_url=f"{endpoint}/api") as mock_api:
-                mock_api.get(f"/animas/{explicit_anima_id}/memory-packs/latest").mock(
-                    return_value=Response(200, json=mock_memory_pack)
-                )
-
-                pack = inject(anima_id=explicit_anima_id)
-
-                assert str(pack.anima_id) == explicit_anima_id
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", "default-anima-id")
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        mock_api.get(f"/animas/{explicit_anima_id}/memory-packs/latest").mock(
+            return_value=Response(200, json=mock_memory_pack)
+        )
+
+        pack = inject(anima_id=explicit_anima_id)
+
+        assert str(pack.anima_id) == explicit_anima_id
+
+    def test_default_client_thread_safe(self, api_key: str, endpoint: str, monkeypatch):
+        """Concurrent first calls should build a single default client."""
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: fn._get_client(), range(8)))
+
+        assert all(c is clients[0] for c in clients)
+
+    @pytest.mark.parametrize("flag,expected_calls", [("1", 1), ("0", 0), (None, 0)])
+    def test_default_client_warmup_follows_env(
+        self, api_key: str, endpoint: str, flag: str | None, expected_calls: int, monkeypatch
+    ):
+        """_get_client() should call warmup() only when ELEPHANTASM_WARMUP is set."""
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", endpoint)
+        if flag is None:
+            monkeypatch.delenv("ELEPHANTASM_WARMUP", raising=False)
+        else:
+            monkeypatch.setenv("ELEPHANTASM_WARMUP", flag)
+        calls = []
+        monkeypatch.setattr(fn.Elephantasm, "warmup", lambda self: calls.append(self))
+
+        client = fn._get_client()
+
+        assert len(calls) == expected_calls
+        assert all(c is client for c in calls)
+
+    def test_ainject_across_event_loops(
+        self, api_key: str, anima_id: str, local_server: str, mock_api, monkeypatch
+    ):
+        """ainject() should work from successive asyncio.run() calls."""
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", anima_id)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", local_server)
+        mock_api.route(host="127.0.0.1").pass_through()
+
+        first = asyncio.run(ainject())
+        second = asyncio.run(ainject())
+
+        assert first.session_memory_count == 2
+        assert second.session_memory_count == 2
+
+    def test_async_client_closed_with_its_loop(
+        self, api_key: str, anima_id: str, local_server: str, mock_api, monkeypatch
+    ):
+        """The default async client should be closed and dropped when asyncio.run() exits."""
+        monkeypatch.setenv("ELEPHANTASM_API_KEY", api_key)
+        monkeypatch.setenv("ELEPHANTASM_ANIMA_ID", anima_id)
+        monkeypatch.setenv("ELEPHANTASM_ENDPOINT", local_server)
+        mock_api.route(host="127.0.0.1").pass_through()
+
+        async def run():
+            await ainject()
+            return await fn._get_async_client()
+
+        clients = [asyncio.run(run()) for _ in range(3)]
+
+        assert fn._default_async_clients == {}
+        assert len({id(c) for c in clients}) == 3
+        assert all(c._client.is_closed for c in clients)
@@ -0,0 +1,35 @@
+"""Tests for the package's lazy top-level exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import elephantasm
+
+
+class TestLazyImports:
+    """Tests for PEP 562 attribute loading in elephantasm/__init__.py."""
+
+    def test_import_does_not_load_http_stack(self):
+        """Importing the package should not import httpx or pydantic."""
+        code = (
+            "import sys, elephantasm; "
+            "assert 'httpx' not in sys.modules; "
+            "assert 'pydantic' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ should be importable from the package."""
+        for name in elephantasm.__all__:
+            assert getattr(elephantasm, name) is not None
+
+    def test_dir_lists_lazy_names(self):
+        """dir() should include names that have not been loaded yet."""
+        assert set(elephantasm.__all__) <= set(dir(elephantasm))
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            elephantasm.Missing